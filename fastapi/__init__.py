@@ -7,30 +7,78 @@ Only the small surface area used by the scaffold is implemented.
 from __future__ import annotations
 
 import asyncio
+import functools
 import inspect
+import json
+import logging
+import sys
 import urllib.parse
-from types import SimpleNamespace
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+from types import MappingProxyType, UnionType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union, get_args, get_origin, get_type_hints
 
 from pydantic import BaseModel
 
+logger = logging.getLogger("fastapi")
+
 
 class HTTPException(Exception):
+    __slots__ = ("status_code", "detail")
+
     def __init__(self, status_code: int, detail: str | None = None):
         super().__init__(detail)
         self.status_code = status_code
         self.detail = detail or ""
 
 
+# Shared read-only mapping for requests without headers (the common TestClient case).
+_EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+# Header names the middlewares look up on every request; already-lowercase keys
+# in this set skip str.lower() and every stored key is interned for fast lookups.
+_KNOWN_HEADERS = frozenset(
+    sys.intern(name) for name in ("authorization", "content-type", "origin", "x-api-key", "x-request-id")
+)
+
+
+class _URL:
+    __slots__ = ("path",)
+
+    def __init__(self, path: str):
+        self.path = path
+
+
 class Request:
-    def __init__(self, headers: Optional[Dict[str, str]] = None, url: Optional[str] = None, query_params=None):
-        self.headers = {k.lower(): v for k, v in (headers or {}).items()}
-        self.url = SimpleNamespace(path=url or "")
+    __slots__ = ("method", "headers", "url", "query_params", "path_params", "_route", "_body", "_raw")
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        url: Optional[str] = None,
+        query_params=None,
+        path_params: Optional[Dict[str, str]] = None,
+        method: str = "GET",
+    ):
+        self.method = method
+        if not headers:
+            self.headers = _EMPTY_HEADERS
+        else:
+            self.headers = {
+                (k if k in _KNOWN_HEADERS else sys.intern(k.lower())): v for k, v in headers.items()
+            }
+        self.url = _URL(url or "")
         self.query_params = query_params or {}
+        self.path_params = path_params or {}
+        self._route: Optional[Dict[str, Any]] = None
+        self._body: Any = None
+        self._raw = b""
+
+    async def body(self) -> bytes:
+        return self._raw
 
 
 class Response:
-    def __init__(self, content: Any, status_code: int = 200, headers: Optional[Dict[str, str]] = None):
+    __slots__ = ("content", "status_code", "headers")
+
+    def __init__(self, content: Any = None, status_code: int = 200, headers: Optional[Dict[str, str]] = None):
         self.content = content
         self.status_code = status_code
         self.headers: Dict[str, str] = headers or {}
@@ -38,37 +86,179 @@ class Response:
     def json(self) -> Any:
         return self.content
 
+    def _consume(self) -> None:
+        """Hook letting TestClient materialize lazily produced bodies."""
+
+
+def _resolve_caster(hinted: Any) -> Optional[Callable[[str], Any]]:
+    """Return the callable used to coerce a query value, or None to keep the raw string."""
+
+    if hinted in (int, float):
+        return hinted
+    if get_origin(hinted) in (Union, UnionType):
+        # handle Optional[int] / Optional[float]-like unions
+        return next((t for t in get_args(hinted) if t in (int, float)), None)
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _handler_signature(func: Callable) -> tuple:
+    """Return ``(parameters, type_hints)`` for a handler, resolved once per function.
+
+    Handlers registered on several routes or apps share the result, and the
+    string annotations produced by ``from __future__ import annotations`` are
+    only evaluated the first time.
+    """
+
+    return tuple(inspect.signature(func).parameters.values()), get_type_hints(func)
+
+
+_FROM_PATH = "path"
+_FROM_REQUEST = "request"
+_FROM_QUERY_OR_BODY = "query"
+
+
+def _build_binder(params: tuple, type_hints: Dict[str, Any], path_names: frozenset) -> Callable:
+    """Return a callable mapping the request, query and body values onto a handler's keyword args.
+
+    Where each parameter comes from is fixed by the route, so that decision and
+    the type hint lookup happen once instead of per request.
+    """
+
+    steps = []
+    for param in params:
+        hinted = type_hints.get(param.name, param.annotation)
+        if param.name in path_names:
+            source = _FROM_PATH
+        elif hinted is Request:
+            source = _FROM_REQUEST
+        else:
+            source = _FROM_QUERY_OR_BODY
+        steps.append((param.name, source, _resolve_caster(hinted)))
+    steps = tuple(steps)
+
+    def bind(request: "Request", parsed: Any) -> Dict[str, Any]:
+        path_params = request.path_params
+        query = request.query_params
+        kwargs = {}
+        for name, source, caster in steps:
+            if source is _FROM_PATH:
+                kwargs[name] = path_params[name]
+            elif source is _FROM_REQUEST:
+                kwargs[name] = request
+            elif name in query:
+                value = query[name]
+                if caster is not None:
+                    try:
+                        value = caster(value)
+                    except (TypeError, ValueError):
+                        pass  # mirror the lenient shim behaviour and hand over the raw string
+                kwargs[name] = value
+            elif parsed is not None:
+                kwargs[name] = parsed
+                parsed = None  # only consume once
+        return kwargs
+
+    return bind
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_query(query_string: str) -> tuple:
+    # parse_qsl runs the splitting/unquoting in C; clients tend to repeat the same URLs.
+    return tuple(urllib.parse.parse_qsl(query_string, keep_blank_values=True))
+
+
+def _compile_path(path: str) -> tuple:
+    """Split a route pattern into ``(is_param, literal_or_name)`` segments."""
+
+    return tuple(
+        (True, part.strip("{}") or "param") if part.startswith("{") and part.endswith("}") else (False, part)
+        for part in path.strip("/").split("/")
+    )
+
+
+def _new_node() -> Dict[str, Any]:
+    return {"_children": {}, "_param": None, "_handlers": {}}
+
 
 class FastAPI:
-    def __init__(self, title: str = ""):
+    def __init__(self, title: str = "", default_response_class: type = None):
         self.title = title
+        self.default_response_class = default_response_class or Response
         self.routes: List[Dict[str, Any]] = []
         self.middlewares: List[Callable] = []
+        self.user_middleware: List[tuple] = []
+        self._asgi: Optional[Callable] = None
+        # Radix-style trie built at registration time: each node holds static
+        # children, a single ``{param}`` child and the handlers terminating there.
+        self._trie: Dict[str, Any] = _new_node()
+        self._chain: Optional[Callable] = None
+        # Per-app memo of (method, path) -> (route, param values); cleared when routes change.
+        self._lookup = functools.lru_cache(maxsize=1024)(self._lookup_route)
+
+    def _add_route(self, method: str, path: str, func: Callable) -> None:
+        compiled = _compile_path(path)
+        param_names = [value for is_param, value in compiled if is_param]
+        params, type_hints = _handler_signature(func)
+        model_annotation = next(
+            (
+                type_hints.get(param.name, param.annotation)
+                for param in params
+                if isinstance(type_hints.get(param.name, param.annotation), type)
+                and issubclass(type_hints.get(param.name, param.annotation), BaseModel)
+            ),
+            None,
+        )
+        route = {
+            "method": method,
+            "path": path,
+            "compiled": compiled,
+            "handler": func,
+            "param_names": tuple(param_names),
+            # Reflection is resolved once here rather than on every dispatch.
+            "params": params,
+            "fastpath": not params,
+            "is_async": inspect.iscoroutinefunction(func),
+            "model": model_annotation,
+            "binder": _build_binder(params, type_hints, frozenset(param_names)),
+        }
+        self.routes.append(route)
+
+        node = self._trie
+        for is_param, value in compiled:
+            if is_param:
+                if node["_param"] is None:
+                    node["_param"] = _new_node()
+                node = node["_param"]
+            else:
+                node = node["_children"].setdefault(value, _new_node())
+        node["_handlers"][method] = route
+        self._lookup.cache_clear()
 
     def get(self, path: str):
         def decorator(func: Callable):
-            self.routes.append({"method": "GET", "path": path, "handler": func})
+            self._add_route("GET", path, func)
             return func
 
         return decorator
 
     def post(self, path: str):
         def decorator(func: Callable):
-            self.routes.append({"method": "POST", "path": path, "handler": func})
+            self._add_route("POST", path, func)
             return func
 
         return decorator
 
     def patch(self, path: str):
         def decorator(func: Callable):
-            self.routes.append({"method": "PATCH", "path": path, "handler": func})
+            self._add_route("PATCH", path, func)
             return func
 
         return decorator
 
     def delete(self, path: str):
         def decorator(func: Callable):
-            self.routes.append({"method": "DELETE", "path": path, "handler": func})
+            self._add_route("DELETE", path, func)
             return func
 
         return decorator
@@ -76,118 +266,279 @@ class FastAPI:
     def middleware(self, _type: str):
         def decorator(func: Callable):
             self.middlewares.append(func)
+            self._chain = None
             return func
 
         return decorator
 
-    def _match_path(self, route_path: str, request_path: str) -> Optional[Dict[str, str]]:
-        route_parts = route_path.strip("/").split("/")
-        request_parts = request_path.strip("/").split("/")
-
-        if len(route_parts) != len(request_parts):
-            return None
-
-        params: Dict[str, str] = {}
-        for route_part, request_part in zip(route_parts, request_parts):
-            if route_part.startswith("{") and route_part.endswith("}"):
-                params[route_part.strip("{}") or "param"] = request_part
-            elif route_part != request_part:
-                return None
-        return params
+    def _match_path(
+        self, node: Dict[str, Any], method: str, parts: List[str], depth: int, values: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        if depth == len(parts):
+            return node["_handlers"].get(method)
+
+        part = parts[depth]
+        child = node["_children"].get(part)
+        if child is not None:
+            route = self._match_path(child, method, parts, depth + 1, values)
+            if route is not None:
+                return route
+
+        if node["_param"] is not None:
+            values.append(part)
+            route = self._match_path(node["_param"], method, parts, depth + 1, values)
+            if route is not None:
+                return route
+            values.pop()
+        return None
+
+    def _lookup_route(self, method: str, path: str) -> tuple[Dict[str, Any], tuple]:
+        values: List[str] = []
+        route = self._match_path(self._trie, method, path.strip("/").split("/"), 0, values)
+        if route is None:
+            raise ValueError(f"Route not found: {method} {path}")
+        return route, tuple(values)
+
+    def _path_exists(self, path: str) -> bool:
+        """Whether any method is routed at ``path``; separates a 405 from a 404."""
+
+        parts = path.strip("/").split("/")
+        methods = {route["method"] for route in self.routes}
+        return any(self._match_path(self._trie, method, parts, 0, []) is not None for method in methods)
 
     def _find_route(self, method: str, path: str) -> tuple[Dict[str, Any], Dict[str, str]]:
-        for route in self.routes:
-            if route["method"] != method:
-                continue
-            params = self._match_path(route["path"], path)
-            if params is not None:
-                return route, params
-        raise ValueError(f"Route not found: {method} {path}")
-
-    async def _dispatch(self, method: str, path: str, headers: Dict[str, str], body: Any = None) -> Response:
-        clean_path, query_params = path.split("?", 1) if "?" in path else (path, "")
-        query: Dict[str, str] = {}
-        if query_params:
-            for pair in query_params.split("&"):
-                if "=" in pair:
-                    key, value = pair.split("=", 1)
-                    query[urllib.parse.unquote_plus(key)] = urllib.parse.unquote_plus(value)
-
-        route, path_params = self._find_route(method, clean_path)
-        request = Request(headers=headers, url=clean_path, query_params=query)
-        request.path_params = path_params
-
-        async def endpoint(_: Request) -> Response:
-            handler = route["handler"]
-            parsed = body
-            signature = inspect.signature(handler)
-            params = list(signature.parameters.values())
-            type_hints = get_type_hints(handler)
-            if body is not None and params:
-                model_annotation = next(
-                    (
-                        type_hints.get(param.name, param.annotation)
-                        for param in params
-                        if isinstance(type_hints.get(param.name, param.annotation), type)
-                        and issubclass(type_hints.get(param.name, param.annotation), BaseModel)
-                    ),
-                    None,
-                )
-                if isinstance(model_annotation, type) and issubclass(model_annotation, BaseModel):
-                    parsed = model_annotation(**body)
-
-            args = []
-            for param in params:
-                if param.name in path_params:
-                    args.append(path_params[param.name])
-                elif param.name in request.query_params:
-                    hinted = type_hints.get(param.name, param.annotation)
-                    value = request.query_params[param.name]
-                    try:
-                        if hinted in (int, float):
-                            casted = hinted(value)
-                        elif getattr(hinted, "__origin__", None) is None and hasattr(hinted, "__args__"):
-                            # handle Optional[int] / Optional[float]-like unions
-                            inner = next((t for t in hinted.__args__ if t in (int, float)), None)
-                            casted = inner(value) if inner else value
-                        else:
-                            casted = value
-                    except Exception:  # pragma: no cover - defensive fallback
-                        casted = value
-                    args.append(casted)
-                elif parsed is not None:
-                    args.append(parsed)
-                    parsed = None  # only consume once
-            result = handler(*args) if args else handler()
-            return result if isinstance(result, Response) else Response(result)
-
-        call_next = endpoint
-        for middleware in reversed(self.middlewares):
-            previous = call_next
+        route, values = self._lookup(method, path)
+        return route, dict(zip(route["param_names"], values))
+
+    def add_middleware(self, middleware_class: type, **options: Any) -> None:
+        # Starlette semantics: the middleware added last is the outermost layer.
+        self.user_middleware.insert(0, (middleware_class, options))
+        self._asgi = None
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if self._asgi is None:
+            app = self._handle_http
+            for middleware_class, options in reversed(self.user_middleware):
+                app = middleware_class(app, **options)
+            self._asgi = app
+        await self._asgi(scope, receive, send)
+
+    async def _handle_http(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        body = b""
+        more_body = True
+        while more_body:
+            message = await receive()
+            body += message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+        path = scope["path"]
+        query_string = scope.get("query_string", b"")
+        if query_string:
+            path = f"{path}?{query_string.decode('latin-1')}"
+        headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in scope.get("headers", ())}
 
-            async def wrapper(req: Request, middleware=middleware, nxt=previous):
-                return await middleware(req, nxt)
-
-            call_next = wrapper
+        try:
+            response = await self._dispatch(scope["method"], path, headers, raw=body)
+        except HTTPException as exc:
+            response = Response({"detail": exc.detail}, status_code=exc.status_code)
+        except Exception:
+            # Like Starlette's ServerErrorMiddleware: the client still gets an answer.
+            logger.exception("unhandled error serving %s %s", scope["method"], scope["path"])
+            response = Response({"detail": "Internal Server Error"}, status_code=500)
+        response._consume()
+
+        payload, content_type = _encode_content(response.content)
+        raw_headers = [(name.encode("latin-1"), value.encode("latin-1")) for name, value in response.headers.items()]
+        if content_type and not any(name.lower() == b"content-type" for name, _ in raw_headers):
+            raw_headers.append((b"content-type", content_type))
+        await send({"type": "http.response.start", "status": response.status_code, "headers": raw_headers})
+        await send({"type": "http.response.body", "body": payload})
+
+    async def _dispatch(
+        self, method: str, path: str, headers: Optional[Dict[str, str]], body: Any = None, raw: bytes = b""
+    ) -> Response:
+        clean_path, _, query_string = path.partition("?")
+        query: Dict[str, str] = dict(_parse_query(query_string)) if query_string else {}
 
-        return await call_next(request)
+        try:
+            route, path_params = self._find_route(method, clean_path)
+        except ValueError:
+            # Like Starlette, let middleware see preflights for paths without an
+            # OPTIONS route; the endpoint answers 405 if nothing intercepts them.
+            if method != "OPTIONS":
+                if self._path_exists(clean_path):
+                    raise HTTPException(status_code=405, detail="Method Not Allowed") from None
+                raise HTTPException(status_code=404, detail="Not Found") from None
+            route, path_params = None, {}
+        if body is None and raw and route is not None:
+            body = _decode_json_body(raw, headers, route)
+        request = Request(
+            headers=headers, url=clean_path, query_params=query, path_params=path_params, method=method
+        )
+        request._route = route
+        request._body = body
+        request._raw = raw
+
+        if self._chain is None:
+            self._chain = self._build_chain()
+        return await self._chain(request)
+
+    def _build_chain(self) -> Callable:
+        """Compose the middleware stack once; rebuilt only when middleware is added."""
+
+        call_next = self._endpoint
+        for middleware in reversed(self.middlewares):
+            # Plain functions handing back the middleware's coroutine: each layer
+            # costs one coroutine frame rather than a wrapper frame plus the middleware.
+            call_next = functools.partial(_call_middleware, middleware, call_next)
+        return call_next
+
+    async def _endpoint(self, request: Request) -> Response:
+        route = request._route
+        if route is None:
+            raise HTTPException(status_code=405, detail="Method Not Allowed")
+        handler = route["handler"]
+        if route["fastpath"]:
+            result = handler()
+        else:
+            parsed = request._body
+            if parsed is not None and route["model"] is not None:
+                if not isinstance(parsed, dict):
+                    raise HTTPException(status_code=422, detail="request body must be a JSON object")
+                parsed = route["model"](**parsed)
+            result = handler(**route["binder"](request, parsed))
+
+        if route["is_async"]:
+            result = await result
+        return result if isinstance(result, Response) else self.default_response_class(result)
+
+
+def _decode_json_body(raw: bytes, headers: Optional[Dict[str, str]], route: Dict[str, Any]) -> Any:
+    """Parse a JSON body for routes binding a body model; other routes read ``Request.body()``.
+
+    A missing content type is taken as JSON only for model routes, so raw
+    octet-stream uploads sent without the header are never parsed.
+    """
+
+    if route["model"] is None:
+        return None
+    content_type = (headers or {}).get("content-type")
+    if content_type is not None and not content_type.startswith("application/json"):
+        return None
+    try:
+        return json.loads(raw)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail="request body must be valid JSON") from exc
+
+
+def _dump_json(value: Any) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+def _encode_content(content: Any) -> tuple[bytes, Optional[bytes]]:
+    if content is None:
+        return b"", None
+    if isinstance(content, bytes):
+        return content, b"application/octet-stream"
+    if isinstance(content, str):
+        return content.encode("utf-8"), b"text/plain; charset=utf-8"
+    return _dump_json(content), b"application/json"
+
+
+def _decode_content(body: bytes, content_type: str) -> Any:
+    if not body:
+        return None
+    if content_type.startswith("application/json"):
+        return json.loads(body)
+    if content_type.startswith("text/"):
+        return body.decode("utf-8")
+    return body
+
+
+def _call_middleware(middleware: Callable, call_next: Callable, request: Request):
+    return middleware(request, call_next)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
 
 
 class TestClient:
     def __init__(self, app: FastAPI):
         self.app = app
-
-    def request(self, method: str, path: str, headers: Optional[Dict[str, str]] = None, json: Any = None) -> Response:
-        try:
-            return asyncio.run(self.app._dispatch(method, path, headers or {}, json))
-        except HTTPException as exc:  # pragma: no cover - mirrors FastAPI behavior
-            return Response({"detail": exc.detail}, status_code=exc.status_code)
+        # One loop per client instead of asyncio.run() spinning a fresh loop per request.
+        self._loop = _new_event_loop()
+
+    def __enter__(self) -> "TestClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        loop = getattr(self, "_loop", None)
+        if loop is not None and not loop.is_closed():
+            loop.close()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[Dict[str, str]] = None,
+        json: Any = None,
+        content: Optional[bytes] = None,
+    ) -> Response:
+        headers = dict(headers or {})
+        if content is not None:
+            body = content
+        elif json is not None:
+            body = _dump_json(json)
+            headers.setdefault("content-type", "application/json")
+        else:
+            body = b""
+        if body:
+            headers.setdefault("content-length", str(len(body)))
+        clean_path, _, query_string = path.partition("?")
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": clean_path,
+            # Clients percent-encode non-ASCII query values before they hit the wire.
+            "query_string": urllib.parse.quote(query_string, safe="=&%+").encode("ascii"),
+            "headers": [
+                (name.lower().encode("latin-1"), value.encode("latin-1")) for name, value in headers.items()
+            ],
+        }
+        messages: List[Dict[str, Any]] = []
+
+        async def receive() -> Dict[str, Any]:
+            return {"type": "http.request", "body": body, "more_body": False}
+
+        async def send(message: Dict[str, Any]) -> None:
+            messages.append(message)
+
+        self._loop.run_until_complete(self.app(scope, receive, send))
+
+        start = next(message for message in messages if message["type"] == "http.response.start")
+        response_headers = {name.decode("latin-1"): value.decode("latin-1") for name, value in start["headers"]}
+        content_type = next((value for name, value in response_headers.items() if name.lower() == "content-type"), "")
+        payload = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+        return Response(_decode_content(payload, content_type), status_code=start["status"], headers=response_headers)
 
     def get(self, path: str, headers: Optional[Dict[str, str]] = None) -> Response:
         return self.request("GET", path, headers=headers)
 
-    def post(self, path: str, headers: Optional[Dict[str, str]] = None, json: Any = None) -> Response:
-        return self.request("POST", path, headers=headers, json=json)
+    def post(
+        self, path: str, headers: Optional[Dict[str, str]] = None, json: Any = None, content: Optional[bytes] = None
+    ) -> Response:
+        return self.request("POST", path, headers=headers, json=json, content=content)
 
     def patch(self, path: str, headers: Optional[Dict[str, str]] = None, json: Any = None) -> Response:
         return self.request("PATCH", path, headers=headers, json=json)
@@ -195,13 +546,17 @@ class TestClient:
     def delete(self, path: str, headers: Optional[Dict[str, str]] = None) -> Response:
         return self.request("DELETE", path, headers=headers)
 
+    def options(self, path: str, headers: Optional[Dict[str, str]] = None) -> Response:
+        return self.request("OPTIONS", path, headers=headers)
 
-status = SimpleNamespace(
-    HTTP_401_UNAUTHORIZED=401,
-    HTTP_404_NOT_FOUND=404,
-    HTTP_400_BAD_REQUEST=400,
-    HTTP_429_TOO_MANY_REQUESTS=429,
-)
+
+class status:
+    HTTP_204_NO_CONTENT = 204
+    HTTP_400_BAD_REQUEST = 400
+    HTTP_401_UNAUTHORIZED = 401
+    HTTP_404_NOT_FOUND = 404
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE = 413
+    HTTP_429_TOO_MANY_REQUESTS = 429
 
 
 __all__ = ["FastAPI", "HTTPException", "Request", "Response", "TestClient", "status"]
@@ -0,0 +1,35 @@
+"""Response classes mirroring ``fastapi.responses`` for the offline shim."""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional
+
+from fastapi import Response
+
+
+class JSONResponse(Response):
+    __slots__ = ()
+
+
+class ORJSONResponse(JSONResponse):
+    __slots__ = ()
+
+
+class StreamingResponse(Response):
+    __slots__ = ("media_type",)
+
+    def __init__(
+        self,
+        content: Iterable[Any],
+        status_code: int = 200,
+        headers: Optional[Dict[str, str]] = None,
+        media_type: Optional[str] = None,
+    ):
+        super().__init__(content, status_code=status_code, headers=headers)
+        self.media_type = media_type
+
+    def _consume(self) -> None:
+        chunks = list(self.content)
+        self.content = b"".join(chunks) if chunks and isinstance(chunks[0], bytes) else "".join(chunks)
+
+
+__all__ = ["JSONResponse", "ORJSONResponse", "Response", "StreamingResponse"]
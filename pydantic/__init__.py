@@ -8,11 +8,10 @@ from __future__ import annotations
 
 class BaseModel:
     def __init__(self, **kwargs):
-        for key, value in kwargs.items():
-            setattr(self, key, value)
+        self.__dict__.update(kwargs)
 
     def model_dump(self):
-        return self.__dict__
+        return self.__dict__.copy()
 
 
 __all__ = ["BaseModel"]
@@ -20,23 +20,41 @@ for sp in reversed(site_packages):
         sys.path.remove(sp)
     sys.path.insert(0, sp)
 
+import importlib.util
+
 import uvicorn
 from uvicorn.config import Config
 
-from python_services.api.server import app
-from python_services.config import ServiceSettings, configure_logging
+from python_services.api.server import app, settings
+from python_services.config import configure_logging
+
+APP_IMPORT_PATH = "python_services.api.server:app"
+
+
+def _prefer(native: str, fallback: str) -> str:
+    """Pick the C-backed implementation when it is installed."""
+
+    return native if importlib.util.find_spec(native) is not None else fallback
 
 
 def main() -> None:
-    settings = ServiceSettings.from_env()
+    # Reuse the settings the app was built with instead of re-reading the env.
     configure_logging(settings.log_level)
-    config = Config(
-        app=app,
-        host=settings.host,
-        port=settings.port,
-        reload=settings.reload,
-        log_level=settings.log_level,
-    )
+    options = {
+        "host": settings.host,
+        "port": settings.port,
+        "log_level": settings.log_level,
+        "loop": _prefer("uvloop", "asyncio"),
+        "http": _prefer("httptools", "h11"),
+        "interface": "asgi3",
+    }
+
+    if settings.reload or settings.workers > 1:
+        # uvicorn needs an import string to spawn reloader or worker processes.
+        uvicorn.run(APP_IMPORT_PATH, reload=settings.reload, workers=settings.workers, **options)
+        return
+
+    config = Config(app=app, **options)
     server = uvicorn.Server(config)
     server.run()
 
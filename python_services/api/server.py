@@ -6,22 +6,32 @@ diarization pipelines when models are available.
 """
 from __future__ import annotations
 
-import collections
+import asyncio
+import base64
+import binascii
+import hmac
 import logging
-import uuid
-from dataclasses import asdict
-from typing import Callable, List
+import os
+import sys
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Sequence, Tuple
 
 from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from python_services.config import ServiceSettings
-from python_services.diarization.diarization_service import DiarizationService
+from python_services.diarization.diarization_service import DiarizationService, DiarizedColumns, DiarizedSegment
+from python_services.ops.batching import DynamicBatcher
 from python_services.ops.metrics import MetricsRegistry
 from python_services.ops import support
 from python_services.sessions import SessionStore
-from python_services.storage import persistence
 from python_services.storage import manifests
+from python_services.storage import persistence
 from python_services.storage.manifests import SessionExport, TranscriptManifest
 from python_services.stt.whisper_service import Transcript, WhisperService
 from python_services.summarization.summarizer import Summarizer
@@ -31,95 +41,379 @@ from python_services.vad.simple_vad import SpeechSpan, detect_speech
 settings = ServiceSettings.from_env()
 logger = logging.getLogger("python_services.api")
 
-app = FastAPI(title="Meeting Assistant Services")
+try:
+    import orjson  # noqa: F401 - only probing availability for the response class
+except ImportError:  # pragma: no cover - depends on the installed extras
+    _default_response_class = JSONResponse
+else:
+    _default_response_class = ORJSONResponse
+
+app = FastAPI(title="Meeting Assistant Services", default_response_class=_default_response_class)
+# Endpoints with large payloads (audio samples, full exports) wrap their dict in
+# this class themselves: a returned Response skips FastAPI's jsonable_encoder pass,
+# which otherwise walks every element before the response class serializes it.
+_json_response = _default_response_class
+
+
+class TokenBucket:
+    """Per-minute request budget refilled continuously at ``max_requests_per_minute / 60`` per second.
 
+    The bucket starts full, so up to a minute's worth of requests may burst
+    through before the refill rate takes over. State is two floats, updated in
+    O(1) per request.
+    """
 
-class RateLimiter:
     def __init__(self, max_requests_per_minute: int | None, now: Callable[[], float] | None = None):
         self.max_requests_per_minute = max_requests_per_minute
-        self._now = now or (lambda: uuid.uuid1().time)  # stable monotonic-ish source without importing time
-        self._events: collections.deque[float] = collections.deque()
+        self.capacity = float(max(max_requests_per_minute or 0, 0))
+        self.rate = self.capacity / 60
+        self._now = now or time.monotonic
+        self._tokens = self.capacity
+        self._last = self._now()
+        self._lock = threading.Lock()
 
     def allow(self) -> bool:
         if self.max_requests_per_minute is None:
             return True
 
-        current = self._now()
-        cutoff = current - (60 * 10**7)  # uuid time is in 100-ns increments
-        while self._events and self._events[0] < cutoff:
-            self._events.popleft()
-
-        if len(self._events) >= self.max_requests_per_minute:
+        with self._lock:
+            current = self._now()
+            tokens = min(self.capacity, self._tokens + (current - self._last) * self.rate)
+            self._last = current
+            if tokens >= 1:
+                self._tokens = tokens - 1
+                return True
+            self._tokens = tokens
             return False
 
-        self._events.append(current)
-        return True
-
-
-@app.middleware("http")
-async def enforce_security(request: Request, call_next):
-    request_id = request.headers.get(settings.request_id_header) or str(uuid.uuid4())
-
-    if settings.api_key:
-        provided = request.headers.get("x-api-key")
-        if provided != settings.api_key:
-            logger.warning("rejecting request: missing or invalid API key", extra={"path": request.url.path})
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid api key")
-
-    if not rate_limiter.allow():
-        logger.warning("rejecting request: rate limit exceeded", extra={"path": request.url.path})
-        raise HTTPException(status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail="rate limit exceeded")
-
-    response = await call_next(request)
-    response.headers[settings.request_id_header] = request_id
-    return response
-
-
-@app.middleware("http")
-async def apply_cors(request: Request, call_next):
-    response = await call_next(request)
-    origin = request.headers.get("origin")
-    if settings.allowed_origins:
-        allow_any = "*" in settings.allowed_origins
-        if allow_any or (origin and origin in settings.allowed_origins):
-            response.headers["access-control-allow-origin"] = origin if origin and not allow_any else "*"
-            response.headers["access-control-allow-headers"] = "*"
-            response.headers["access-control-allow-methods"] = "GET,POST,DELETE,OPTIONS"
-    return response
-
-# Lazy-loaded services to avoid blocking startup with model downloads
-_stt_instance = None
-_diarization_instance = None
-_tts_instance = None
-_summarizer_instance = None
-
-def get_stt():
-    global _stt_instance
-    if _stt_instance is None:
-        _stt_instance = WhisperService()
-    return _stt_instance
-
-def get_diarization():
-    global _diarization_instance
-    if _diarization_instance is None:
-        _diarization_instance = DiarizationService()
-    return _diarization_instance
-
-def get_tts():
-    global _tts_instance
-    if _tts_instance is None:
-        _tts_instance = TextToSpeechService()
-    return _tts_instance
-
-def get_summarizer():
-    global _summarizer_instance
-    if _summarizer_instance is None:
-        _summarizer_instance = Summarizer()
-    return _summarizer_instance
+
+# Header names and values as the raw bytes found in ASGI ``scope["headers"]``.
+_REQ_ID_HEADER = settings.request_id_header.lower().encode("latin-1")
+_API_KEY_HEADER = b"x-api-key"
+_ORIGIN_HEADER = b"origin"
+_CONTENT_LENGTH_HEADER = b"content-length"
+_API_KEY = settings.api_key.encode("latin-1") if settings.api_key else None
+_ALLOWED_ORIGINS = frozenset(origin.encode("latin-1") for origin in settings.allowed_origins or ())
+_ALLOW_ANY_ORIGIN = b"*" in _ALLOWED_ORIGINS
+_CORS_STATIC_HEADERS = (
+    (b"access-control-allow-headers", b"*"),
+    (b"access-control-allow-methods", b"GET,POST,DELETE,OPTIONS"),
+)
+_CORS_ANY_ORIGIN_HEADERS = ((b"access-control-allow-origin", b"*"), *_CORS_STATIC_HEADERS)
+# Lets browsers reuse a preflight answer for ten minutes instead of re-asking
+# before every cross-origin request.
+_PREFLIGHT_MAX_AGE_HEADER = (b"access-control-max-age", b"600")
+_MAX_BODY_BYTES = settings.max_body_bytes
+_JSON_HEADER = (b"content-type", b"application/json")
+_INVALID_API_KEY_BODY = b'{"detail":"invalid api key"}'
+_RATE_LIMITED_BODY = b'{"detail":"rate limit exceeded"}'
+_BODY_TOO_LARGE_BODY = b'{"detail":"request body too large"}'
+_INVALID_CONTENT_LENGTH_BODY = b'{"detail":"invalid content-length"}'
+
+
+class _RequestIdPool(threading.local):
+    """Hex request ids carved from one ``os.urandom`` read per 256 ids.
+
+    Request ids only correlate logs, so amortizing the urandom syscall across
+    a batch is fine; nothing here is used as a secret.
+    """
+
+    BATCH_BYTES = 4096
+
+    def __init__(self) -> None:
+        self._hex = b""
+        self._offset = 0
+
+    def next(self) -> bytes:
+        offset = self._offset
+        if offset >= len(self._hex):
+            self._hex = os.urandom(self.BATCH_BYTES).hex().encode("ascii")
+            offset = 0
+        self._offset = offset + 32
+        return self._hex[offset : offset + 32]
+
+
+_request_ids = _RequestIdPool()
+
+
+async def _send_response(send, status_code: int, body: bytes, headers: List[Tuple[bytes, bytes]]) -> None:
+    await send({"type": "http.response.start", "status": status_code, "headers": headers})
+    await send({"type": "http.response.body", "body": body})
+
+
+class _BodyTooLarge(Exception):
+    """Raised from the receive wrapper once a streamed body passes ``max_body_bytes``."""
+
+
+class SecurityMiddleware:
+    """Authenticate, then stamp request-id and CORS headers in one pass.
+
+    Written against raw ASGI rather than ``@app.middleware("http")`` so requests
+    skip Starlette's BaseHTTPMiddleware task group and Request/Response wrapping;
+    headers are read straight from ``scope`` and stamped onto the start message.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = origin = provided_key = content_length = None
+        for name, value in scope["headers"]:
+            if name == _REQ_ID_HEADER:
+                request_id = value
+            elif name == _ORIGIN_HEADER:
+                origin = value
+            elif name == _API_KEY_HEADER:
+                provided_key = value
+            elif name == _CONTENT_LENGTH_HEADER:
+                content_length = value
+
+        stamped = [(_REQ_ID_HEADER, request_id or _request_ids.next())]
+        # Only cross-origin browser requests carry Origin; same-origin calls and
+        # server-to-server clients get no CORS headers at all.
+        cors_allowed = origin is not None and (_ALLOW_ANY_ORIGIN or origin in _ALLOWED_ORIGINS)
+        if cors_allowed:
+            if _ALLOW_ANY_ORIGIN:
+                stamped.extend(_CORS_ANY_ORIGIN_HEADERS)
+            else:
+                stamped.append((b"access-control-allow-origin", origin))
+                stamped.extend(_CORS_STATIC_HEADERS)
+
+        if scope["method"] == "OPTIONS":
+            # Browsers send preflights without credentials and only need the CORS
+            # headers back, so answer them here instead of walking the route stack.
+            if cors_allowed:
+                stamped.append(_PREFLIGHT_MAX_AGE_HEADER)
+            await _send_response(send, status.HTTP_204_NO_CONTENT, b"", stamped)
+            return
+
+        # compare_digest keeps rejection time independent of how much of the key matched.
+        if _API_KEY is not None and not hmac.compare_digest(provided_key or b"", _API_KEY):
+            logger.warning("rejecting request: missing or invalid API key", extra={"path": scope["path"]})
+            await _send_response(send, status.HTTP_401_UNAUTHORIZED, _INVALID_API_KEY_BODY, [*stamped, _JSON_HEADER])
+            return
+
+        if content_length is not None:
+            declared = int(content_length) if content_length.isdigit() else -1
+            if declared < 0:
+                await _send_response(
+                    send, status.HTTP_400_BAD_REQUEST, _INVALID_CONTENT_LENGTH_BODY, [*stamped, _JSON_HEADER]
+                )
+                return
+            # Refuse oversized uploads (e.g. huge sample lists) before any of the
+            # body is read or parsed when the declared length already decides it.
+            if _MAX_BODY_BYTES is not None and declared > _MAX_BODY_BYTES:
+                logger.warning("rejecting request: body too large", extra={"path": scope["path"]})
+                await _send_response(
+                    send, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _BODY_TOO_LARGE_BODY, [*stamped, _JSON_HEADER]
+                )
+                return
+
+        response_started = False
+
+        async def send_with_headers(message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                message["headers"] = [*message.get("headers", ()), *stamped]
+            await send(message)
+
+        if _MAX_BODY_BYTES is None:
+            await self.app(scope, receive, send_with_headers)
+            return
+
+        # Chunked uploads carry no Content-Length, so also count what actually
+        # arrives and stop reading once the cap is crossed.
+        received = 0
+
+        async def receive_limited():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > _MAX_BODY_BYTES:
+                    raise _BodyTooLarge
+            return message
+
+        try:
+            await self.app(scope, receive_limited, send_with_headers)
+        except _BodyTooLarge:
+            logger.warning("rejecting request: body too large", extra={"path": scope["path"]})
+            if not response_started:
+                await _send_response(
+                    send, status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, _BODY_TOO_LARGE_BODY, [*stamped, _JSON_HEADER]
+                )
+
+
+class RateLimitMiddleware:
+    """Outermost guard answering 429 before any other middleware or routing runs.
+
+    Reads the module-level ``rate_limiter`` on each call so it can be swapped
+    at runtime.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http" and not rate_limiter.allow():
+            logger.warning("rejecting request: rate limit exceeded", extra={"path": scope["path"]})
+            await _send_response(send, status.HTTP_429_TOO_MANY_REQUESTS, _RATE_LIMITED_BODY, [_JSON_HEADER])
+            return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(SecurityMiddleware)
+# Added last so it wraps everything else: rejected requests skip all other work.
+app.add_middleware(RateLimitMiddleware)
+
+
+# Lazy-loaded services to avoid blocking startup with model downloads. Each
+# factory builds its service once; every caller shares that instance.
+@lru_cache(maxsize=None)
+def get_stt() -> WhisperService:
+    return WhisperService()
+
+
+@lru_cache(maxsize=None)
+def get_diarization() -> DiarizationService:
+    return DiarizationService()
+
+
+@lru_cache(maxsize=None)
+def get_tts() -> TextToSpeechService:
+    return TextToSpeechService()
+
+
+@lru_cache(maxsize=None)
+def get_summarizer() -> Summarizer:
+    return Summarizer()
+
+
+_SERVICE_FACTORIES = {
+    "stt": get_stt,
+    "diarization": get_diarization,
+    "tts": get_tts,
+    "summarizer": get_summarizer,
+}
+
+
+def __getattr__(name: str):
+    """Resolve the legacy ``server.stt``-style attributes through the shared factories."""
+
+    factory = _SERVICE_FACTORIES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
+
+
+def _transcribe_items(items: List[Tuple[str, str]]) -> List[Transcript]:
+    """Transcribe ``(content, language)`` pairs with one backend call per language."""
+
+    stt = get_stt()
+    by_language: Dict[str, List[int]] = {}
+    for index, (_, language) in enumerate(items):
+        by_language.setdefault(language, []).append(index)
+
+    results: List[Transcript] = [None] * len(items)  # type: ignore[list-item]
+    for language, indices in by_language.items():
+        transcripts = stt.transcribe_batch([items[index][0] for index in indices], language=language)
+        for index, transcript in zip(indices, transcripts):
+            results[index] = transcript
+    return results
+
+
+def _diarize_items(transcripts: List[Transcript]) -> List[List[DiarizedSegment]]:
+    return get_diarization().diarize_batch(transcripts)
+
+
+def _diarize_column_items(transcripts: List[Transcript]) -> List[DiarizedColumns]:
+    return get_diarization().diarize_columns_batch(transcripts)
+
+
+# Every blocking model call runs here. Sizing it to the hardware keeps a burst
+# of requests queued rather than oversubscribing the CPU/GPU with threads.
+inference_pool = ThreadPoolExecutor(
+    max_workers=max(1, settings.inference_threads), thread_name_prefix="inference"
+)
+
+
+async def _run_model(func: Callable, *args, **kwargs):
+    """Run a blocking model call on the inference pool without stalling the event loop."""
+
+    return await asyncio.get_running_loop().run_in_executor(inference_pool, partial(func, *args, **kwargs))
+
+
+transcribe_batcher = DynamicBatcher(
+    _transcribe_items,
+    max_batch_size=settings.max_batch_size,
+    max_wait_ms=settings.batch_wait_ms,
+    executor=inference_pool,
+)
+diarize_batcher = DynamicBatcher(
+    _diarize_items,
+    max_batch_size=settings.max_batch_size,
+    max_wait_ms=settings.batch_wait_ms,
+    executor=inference_pool,
+)
+# For responses that only serialize the diarization, skipping segment objects.
+diarize_columns_batcher = DynamicBatcher(
+    _diarize_column_items,
+    max_batch_size=settings.max_batch_size,
+    max_wait_ms=settings.batch_wait_ms,
+    executor=inference_pool,
+)
+
+
+async def _diarize_text(transcript_id: str, text: str, language: str = "fa") -> TranscriptManifest:
+    """Diarize an already-final transcript string.
+
+    Text input never needs speech recognition (the STT backends only echo it
+    back), so it is wrapped directly and goes straight to the diarize batcher.
+    """
+
+    transcript = Transcript.from_text(text, language)
+    diarized = await diarize_batcher.submit(transcript)
+    return TranscriptManifest.from_diarized(transcript_id=transcript_id, language=transcript.language, segments=diarized)
+
 
 sessions = SessionStore()
 metrics = MetricsRegistry()
-rate_limiter = RateLimiter(settings.max_requests_per_minute)
+
+# Counter handles bound once so handlers skip the registry lookup per request.
+_TRANSCRIBE_CALLS = metrics.counter("transcribe.calls")
+_TRANSCRIBE_BATCH_CALLS = metrics.counter("transcribe.batch.calls")
+_VAD_CALLS = metrics.counter("vad.calls")
+_SESSIONS_INGEST_CALLS = metrics.counter("sessions.ingest.calls")
+_SESSIONS_AUDIO_APPEND_CALLS = metrics.counter("sessions.audio.append.calls")
+_SESSIONS_AUDIO_FETCH_CALLS = metrics.counter("sessions.audio.fetch.calls")
+_SESSIONS_PROCESS_BUFFER_CALLS = metrics.counter("sessions.process_buffer.calls")
+_DIARIZE_CALLS = metrics.counter("diarize.calls")
+_SESSIONS_CREATE = metrics.counter("sessions.create")
+_SESSIONS_APPEND = metrics.counter("sessions.append")
+_SESSIONS_SUMMARY = metrics.counter("sessions.summary")
+_SESSIONS_EXPORT = metrics.counter("sessions.export")
+_SESSIONS_EXPORT_STORE = metrics.counter("sessions.export.store")
+_EXPORTS_LIST = metrics.counter("exports.list")
+_EXPORTS_LOAD = metrics.counter("exports.load")
+_EXPORTS_DOWNLOAD = metrics.counter("exports.download")
+_EXPORTS_RESTORE = metrics.counter("exports.restore")
+_EXPORTS_PRUNE = metrics.counter("exports.prune")
+_SESSIONS_DELETE = metrics.counter("sessions.delete")
+_SESSIONS_GET = metrics.counter("sessions.get")
+_SESSIONS_SEARCH = metrics.counter("sessions.search")
+_SESSIONS_METADATA = metrics.counter("sessions.metadata")
+_SESSIONS_LABEL = metrics.counter("sessions.label")
+_SESSIONS_FORGET = metrics.counter("sessions.forget")
+_SUMMARIZE_CALLS = metrics.counter("summarize.calls")
+_TTS_CALLS = metrics.counter("tts.calls")
+_SUPPORT_BUNDLE = metrics.counter("support.bundle")
+
+rate_limiter = TokenBucket(settings.max_requests_per_minute)
 
 
 class TranscribeRequest(BaseModel):
@@ -127,6 +421,11 @@ class TranscribeRequest(BaseModel):
     language: str = "fa"
 
 
+class TranscribeBatchRequest(BaseModel):
+    contents: List[str]
+    language: str = "fa"
+
+
 class SummarizeRequest(BaseModel):
     transcript: str
     max_points: int = 5
@@ -173,20 +472,23 @@ class ForgetSpeakerRequest(BaseModel):
 
 
 class VadRequest(BaseModel):
-    samples: List[float]
+    samples: List[float] | None = None
+    samples_b64: str | None = None
     threshold: float = 0.01
     min_run: int = 3
 
 
 class SessionIngestRequest(BaseModel):
-    samples: List[float]
+    samples: List[float] | None = None
+    samples_b64: str | None = None
     threshold: float = 0.01
     min_run: int = 3
     transcript_hint: str = "speech detected"
 
 
 class SessionAudioAppendRequest(BaseModel):
-    samples: List[float]
+    samples: List[float] | None = None
+    samples_b64: str | None = None
     trim_to: int | None = None
 
 
@@ -201,16 +503,70 @@ def _translate_session_error(exc: KeyError):
     raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
 
+def _decode_float32(raw: bytes, source: str) -> array:
+    if len(raw) % 4:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"{source} must hold float32 samples")
+    decoded = array("f")
+    decoded.frombytes(raw)
+    if sys.byteorder == "big":
+        decoded.byteswap()
+    return decoded
+
+
+def _request_samples(request) -> Sequence[float]:
+    """Return audio samples from either the JSON list or the base64 float32 payload.
+
+    ``samples_b64`` carries little-endian float32 PCM and is decoded straight into
+    an ``array('f')``, avoiding one Python float per sample during request parsing.
+    """
+
+    if request.samples_b64 is not None:
+        try:
+            raw = base64.b64decode(request.samples_b64, validate=True)
+        except (binascii.Error, ValueError) as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="samples_b64 must be base64") from exc
+        return _decode_float32(raw, "samples_b64")
+
+    if request.samples is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="samples are required")
+    return request.samples
+
+
+_HEALTH_BODY = b'{"status":"ok","message":"scaffold"}'
+
+
 @app.get("/health")
-def healthcheck():
-    return {"status": "ok", "message": "scaffold"}
+async def healthcheck():
+    # Load balancers poll this constantly; hand back pre-encoded bytes so no
+    # per-probe serialization happens. A fresh Response keeps instances unshared.
+    return Response(_HEALTH_BODY, headers={"Content-Type": "application/json"})
 
 
 @app.post("/transcribe")
-def transcribe(request: TranscribeRequest):
-    transcript: Transcript = get_stt().transcribe(request.content, language=request.language)
-    metrics.counter("transcribe.calls").inc()
-    return {"language": transcript.language, "segments": [asdict(s) for s in transcript.segments]}
+async def transcribe(request: TranscribeRequest):
+    transcript: Transcript = await transcribe_batcher.submit((request.content, request.language))
+    _TRANSCRIBE_CALLS.inc()
+    return {"language": transcript.language, "segments": [s.asdict() for s in transcript.segments]}
+
+
+@app.post("/transcribe/batch")
+async def transcribe_batch(request: TranscribeBatchRequest):
+    transcripts: List[Transcript] = await _run_model(
+        get_stt().transcribe_batch, request.contents, language=request.language
+    )
+    _TRANSCRIBE_BATCH_CALLS.inc()
+    return {
+        "results": [
+            {"language": transcript.language, "segments": [s.asdict() for s in transcript.segments]}
+            for transcript in transcripts
+        ]
+    }
+
+
+def _run_vad(samples: Sequence[float], threshold: float, min_run: int) -> Dict[str, object]:
+    spans: List[SpeechSpan] = detect_speech(samples, threshold=threshold, min_run=min_run)
+    _VAD_CALLS.inc()
+    return {"triggered": bool(spans), "segments": [span.asdict() for span in spans]}
 
 
 @app.post("/vad")
@@ -218,18 +574,24 @@ def run_vad(request: VadRequest):
     if request.min_run < 1:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_run must be >= 1")
 
-    spans: List[SpeechSpan] = detect_speech(request.samples, threshold=request.threshold, min_run=request.min_run)
-    metrics.counter("vad.calls").inc()
-    return {"triggered": bool(spans), "segments": [span.asdict() for span in spans]}
+    return _run_vad(_request_samples(request), request.threshold, request.min_run)
 
 
-@app.post("/sessions/{session_id}/ingest")
-def ingest_session_audio(session_id: str, request: SessionIngestRequest):
-    if request.min_run < 1:
+@app.post("/vad/raw")
+async def run_vad_raw(request: Request, threshold: float = 0.01, min_run: int = 3):
+    """VAD over an ``application/octet-stream`` body of little-endian float32 samples."""
+
+    if min_run < 1:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_run must be >= 1")
 
-    spans: List[SpeechSpan] = detect_speech(request.samples, threshold=request.threshold, min_run=request.min_run)
-    metrics.counter("sessions.ingest.calls").inc()
+    return _run_vad(_decode_float32(await request.body(), "body"), threshold, min_run)
+
+
+async def _ingest(
+    session_id: str, samples: Sequence[float], threshold: float, min_run: int, transcript_hint: str
+) -> Dict[str, object]:
+    spans: List[SpeechSpan] = detect_speech(samples, threshold=threshold, min_run=min_run)
+    _SESSIONS_INGEST_CALLS.inc()
 
     if not spans:
         return {
@@ -246,16 +608,14 @@ def ingest_session_audio(session_id: str, request: SessionIngestRequest):
         _translate_session_error(exc)
 
     span_descriptions = [f"speech {span.start_index}-{span.end_index}" for span in spans]
-    transcript_text = request.transcript_hint.strip() or "speech detected"
+    transcript_text = transcript_hint.strip() or "speech detected"
     transcript_text = f"{transcript_text}: {'; '.join(span_descriptions)}"
 
-    transcript = get_stt().transcribe(transcript_text, language=session.language)
-    diarized = get_diarization().diarize(transcript)
-    manifest = TranscriptManifest.from_diarized(
-        transcript_id=session_id, language=transcript.language, segments=diarized
-    )
-
-    session, new_speakers = sessions.append(session_id, manifest.segments)
+    # Straight through the batchers onto the session already in hand: no
+    # intermediate TranscriptManifest and no second store lookup.
+    transcript = await transcribe_batcher.submit((transcript_text, session.language))
+    diarized = await diarize_batcher.submit(transcript)
+    new_speakers = session.append_segments(diarized)
 
     return {
         "session_id": session.session_id,
@@ -266,65 +626,131 @@ def ingest_session_audio(session_id: str, request: SessionIngestRequest):
     }
 
 
-@app.post("/sessions/{session_id}/audio")
-def append_session_audio(session_id: str, request: SessionAudioAppendRequest):
-    if request.trim_to is not None and request.trim_to < 1:
-        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="trim_to must be >= 1 when provided")
+@app.post("/sessions/{session_id}/ingest")
+async def ingest_session_audio(session_id: str, request: SessionIngestRequest):
+    if request.min_run < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_run must be >= 1")
+
+    return await _ingest(
+        session_id, _request_samples(request), request.threshold, request.min_run, request.transcript_hint
+    )
 
-    if not request.samples:
+
+@app.post("/sessions/{session_id}/ingest/raw")
+async def ingest_session_audio_raw(
+    session_id: str,
+    request: Request,
+    threshold: float = 0.01,
+    min_run: int = 3,
+    transcript_hint: str = "speech detected",
+):
+    if min_run < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_run must be >= 1")
+
+    samples = _decode_float32(await request.body(), "body")
+    return await _ingest(session_id, samples, threshold, min_run, transcript_hint)
+
+
+def _append_audio(session_id: str, samples: Sequence[float], trim_to: int | None) -> Dict[str, object]:
+    if not samples:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="samples are required")
 
     try:
-        session = sessions.append_audio(session_id, request.samples, trim_to=request.trim_to)
+        session = sessions.append_audio(session_id, samples, trim_to=trim_to)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
 
-    metrics.counter("sessions.audio.append.calls").inc()
+    _SESSIONS_AUDIO_APPEND_CALLS.inc()
 
     return {
         "session_id": session.session_id,
-        "added": len(request.samples),
-        "buffered": len(session.audio_buffer),
+        "added": len(samples),
+        "buffered": session.buffered,
     }
 
 
+@app.post("/sessions/{session_id}/audio")
+def append_session_audio(session_id: str, request: SessionAudioAppendRequest):
+    if request.trim_to is not None and request.trim_to < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="trim_to must be >= 1 when provided")
+
+    return _append_audio(session_id, _request_samples(request), request.trim_to)
+
+
+@app.post("/sessions/{session_id}/audio/raw")
+async def append_session_audio_raw(session_id: str, request: Request, trim_to: int | None = None):
+    if trim_to is not None and trim_to < 1:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="trim_to must be >= 1 when provided")
+
+    return _append_audio(session_id, _decode_float32(await request.body(), "body"), trim_to)
+
+
 @app.get("/sessions/{session_id}/audio")
-def fetch_session_audio(session_id: str, max_samples: int | None = None):
+async def fetch_session_audio(session_id: str, max_samples: int | None = None):
     try:
-        samples = sessions.audio_samples(session_id, max_samples=max_samples)
-        session = sessions.get(session_id)
+        session, samples = sessions.audio_view(session_id, max_samples)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
 
-    metrics.counter("sessions.audio.fetch.calls").inc()
+    _SESSIONS_AUDIO_FETCH_CALLS.inc()
 
-    return {
-        "session_id": session.session_id,
-        "samples": samples,
-        "returned": len(samples),
-        "buffered": len(session.audio_buffer),
+    return _json_response(
+        {
+            "session_id": session.session_id,
+            "samples": samples,
+            "returned": len(samples),
+            "buffered": session.buffered,
+        }
+    )
+
+
+@app.get("/sessions/{session_id}/audio/raw")
+async def fetch_session_audio_raw(session_id: str, max_samples: int | None = None):
+    """Buffered audio as little-endian float32 bytes, mirroring the raw append endpoint."""
+
+    try:
+        session, window = sessions.audio_view(session_id, max_samples)
+    except KeyError as exc:  # pragma: no cover - exercised via API tests
+        _translate_session_error(exc)
+
+    samples = array("f", window)
+    if sys.byteorder == "big":
+        samples.byteswap()
+    _SESSIONS_AUDIO_FETCH_CALLS.inc()
+
+    headers = {
+        "Content-Type": "application/octet-stream",
+        "X-Buffered-Samples": str(session.buffered),
     }
+    return Response(samples.tobytes(), headers=headers)
 
 
 @app.post("/sessions/{session_id}/process_buffer")
-def process_session_buffer(session_id: str, request: ProcessBufferRequest):
+async def process_session_buffer(session_id: str, request: ProcessBufferRequest):
     if request.min_run < 1:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="min_run must be >= 1")
 
     try:
-        session, spans, new_speakers = sessions.process_audio_buffer(
+        session, spans, transcript_text = sessions.claim_buffer_speech(
             session_id,
-            stt,
-            diarization,
             threshold=request.threshold,
             min_run=request.min_run,
             transcript_hint=request.transcript_hint,
             clear_buffer=request.clear_buffer,
         )
+        new_speakers: List[str] = []
+        if transcript_text is not None:
+            # Share the STT/diarization batchers with /transcribe so concurrent
+            # sessions flushing their buffers land in the same model calls.
+            transcript = await transcribe_batcher.submit((transcript_text, session.language))
+            diarized = await diarize_batcher.submit(transcript)
+            # The session may have been deleted while the models ran; append
+            # through the store so that surfaces as a 404.
+            session, new_speakers = sessions.append(session_id, diarized)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
 
-    metrics.counter("sessions.process_buffer.calls").inc()
+    _SESSIONS_PROCESS_BUFFER_CALLS.inc()
 
     return {
         "session_id": session.session_id,
@@ -332,26 +758,22 @@ def process_session_buffer(session_id: str, request: ProcessBufferRequest):
         "spans": [span.asdict() for span in spans],
         "segments": session.serialized_segments(),
         "new_speakers": new_speakers,
-        "buffered": len(session.audio_buffer),
+        "buffered": session.buffered,
     }
 
 
 @app.post("/diarize")
-def diarize(request: SpeakerRequest):
-    transcript = get_stt().transcribe(request.transcript)
-    diarized = get_diarization().diarize(transcript)
-    manifest = TranscriptManifest.from_diarized(
-        transcript_id="stub", language=transcript.language, segments=diarized
-    )
-    metrics.counter("diarize.calls").inc()
-    return {"transcript_id": manifest.transcript_id, "segments": [asdict(s) for s in manifest.segments]}
+async def diarize(request: SpeakerRequest):
+    columns: DiarizedColumns = await diarize_columns_batcher.submit(Transcript.from_text(request.transcript))
+    _DIARIZE_CALLS.inc()
+    return {"transcript_id": "stub", "segments": columns.asdicts()}
 
 
 @app.post("/sessions")
 def create_session(request: SessionCreateRequest):
     session = sessions.create(request.session_id, language=request.language)
     session.update_metadata(title=request.title, agenda=request.agenda)
-    metrics.counter("sessions.create").inc()
+    _SESSIONS_CREATE.inc()
     return {
         "session_id": session.session_id,
         "language": session.language,
@@ -361,17 +783,13 @@ def create_session(request: SessionCreateRequest):
 
 
 @app.post("/sessions/append")
-def append_to_session(request: SessionAppendRequest):
-    transcript = get_stt().transcribe(request.transcript)
-    diarized = get_diarization().diarize(transcript)
-    manifest = TranscriptManifest.from_diarized(
-        transcript_id=request.session_id, language=transcript.language, segments=diarized
-    )
+async def append_to_session(request: SessionAppendRequest):
+    manifest = await _diarize_text(request.session_id, request.transcript)
     try:
         session, new_speakers = sessions.append(request.session_id, manifest.segments)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    metrics.counter("sessions.append").inc()
+    _SESSIONS_APPEND.inc()
     return {
         "session_id": session.session_id,
         "segments": session.serialized_segments(),
@@ -380,13 +798,13 @@ def append_to_session(request: SessionAppendRequest):
 
 
 @app.get("/sessions/{session_id}/summary")
-def summarize_session(session_id: str):
+async def summarize_session(session_id: str):
     try:
-        session = sessions.get(session_id)
-        summary = sessions.summary(session_id, summarizer)
+        # The summarizer may call out to an LLM; keep that off the event loop.
+        session, summary = await _run_model(sessions.summary, session_id, get_summarizer())
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    metrics.counter("sessions.summary").inc()
+    _SESSIONS_SUMMARY.inc()
     return {
         "session_id": session.session_id,
         "metadata": session.metadata_view(),
@@ -395,34 +813,46 @@ def summarize_session(session_id: str):
     }
 
 
-@app.get("/sessions/{session_id}/export")
-def export_session(session_id: str):
-    try:
-        exported: SessionExport = sessions.export(session_id, summarizer)
-    except KeyError as exc:  # pragma: no cover - exercised via API tests
-        _translate_session_error(exc)
-    metrics.counter("sessions.export").inc()
+def _export_payload(exported: SessionExport) -> Dict[str, object]:
+    created_at = exported.created_at.isoformat()
     return {
         "session_id": exported.session_id,
-        "created_at": exported.created_at.isoformat(),
+        "created_at": created_at,
         "language": exported.language,
-        "metadata": {"title": exported.title, "agenda": exported.agenda, "created_at": exported.created_at.isoformat()},
-        "segments": [asdict(segment) for segment in exported.segments],
+        "metadata": {"title": exported.title, "agenda": exported.agenda, "created_at": created_at},
+        "segments": exported.segment_dicts,
         "summary": {"highlight": exported.summary.highlight, "bullet_points": exported.summary.bullet_points},
     }
 
 
+@app.get("/sessions/{session_id}/export")
+async def export_session(session_id: str):
+    try:
+        exported: SessionExport = await _run_model(sessions.export, session_id, get_summarizer())
+    except KeyError as exc:  # pragma: no cover - exercised via API tests
+        _translate_session_error(exc)
+    _SESSIONS_EXPORT.inc()
+    return _json_response(_export_payload(exported))
+
+
+def _store_export(exported: SessionExport, storage_dir: str, retention_days: int | None):
+    saved_path = persistence.save_export(exported, storage_dir)
+    removed = [] if retention_days is None else persistence.prune_exports(storage_dir, retention_days)
+    return saved_path, removed
+
+
 @app.post("/sessions/{session_id}/export/store")
-def export_and_store(session_id: str):
+async def export_and_store(session_id: str):
     try:
-        exported: SessionExport = sessions.export(session_id, summarizer)
+        # The summarizer may call out to an LLM, so it shares the bounded inference pool.
+        exported: SessionExport = await _run_model(sessions.export, session_id, get_summarizer())
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    saved_path = persistence.save_export(exported, settings.storage_dir)
-    removed = []
-    if settings.export_retention_days is not None:
-        removed = persistence.prune_exports(settings.storage_dir, settings.export_retention_days)
-    metrics.counter("sessions.export.store").inc()
+    # Save and prune together in one worker-thread hop; neither touches shared state.
+    saved_path, removed = await asyncio.to_thread(
+        _store_export, exported, settings.storage_dir, settings.export_retention_days
+    )
+    _SESSIONS_EXPORT_STORE.inc()
     return {
         "session_id": exported.session_id,
         "metadata": {"title": exported.title, "agenda": exported.agenda, "created_at": exported.created_at.isoformat()},
@@ -432,70 +862,62 @@ def export_and_store(session_id: str):
 
 
 @app.get("/exports")
-def list_stored_exports():
-    session_ids = persistence.list_exports(settings.storage_dir)
-    metrics.counter("exports.list").inc()
+async def list_stored_exports():
+    session_ids = await asyncio.to_thread(persistence.list_exports, settings.storage_dir)
+    _EXPORTS_LIST.inc()
     return {"exports": session_ids}
 
 
 @app.get("/exports/{session_id}")
-def fetch_stored_export(session_id: str):
+async def fetch_stored_export(session_id: str):
     try:
-        exported = persistence.load_export(session_id, settings.storage_dir)
+        exported = await asyncio.to_thread(persistence.load_export, session_id, settings.storage_dir)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
-    metrics.counter("exports.load").inc()
-    return {
-        "session_id": exported.session_id,
-        "created_at": exported.created_at.isoformat(),
-        "language": exported.language,
-        "metadata": {"title": exported.title, "agenda": exported.agenda, "created_at": exported.created_at.isoformat()},
-        "segments": [asdict(segment) for segment in exported.segments],
-        "summary": {"highlight": exported.summary.highlight, "bullet_points": exported.summary.bullet_points},
-    }
+    _EXPORTS_LOAD.inc()
+    return _json_response(_export_payload(exported))
+
+
+_FMT_DISPATCH = {
+    "markdown": (manifests.iter_markdown, "text/markdown", "md"),
+    "text": (manifests.iter_text, "text/plain", "txt"),
+}
+_NO_FORMAT = (None, None, None)
 
 
 @app.get("/exports/{session_id}/download")
-def download_export(session_id: str, format: str = "markdown"):
+async def download_export(session_id: str, format: str = "markdown"):
     try:
-        exported = persistence.load_export(session_id, settings.storage_dir)
+        exported = await asyncio.to_thread(persistence.load_export, session_id, settings.storage_dir)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
-    fmt = (format or "markdown").lower()
-    if fmt not in {"markdown", "text"}:
+    render, content_type, extension = _FMT_DISPATCH.get(format.lower() if format else "markdown", _NO_FORMAT)
+    if render is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="format must be one of: markdown, text",
         )
 
-    if fmt == "markdown":
-        body = manifests.render_markdown(exported)
-        content_type = "text/markdown"
-        extension = "md"
-    else:
-        body = manifests.render_text(exported)
-        content_type = "text/plain"
-        extension = "txt"
-
-    metrics.counter("exports.download").inc()
+    body = render(exported)
+    _EXPORTS_DOWNLOAD.inc()
     headers = {
         "Content-Type": content_type,
         "Content-Disposition": f'attachment; filename="{session_id}.{extension}"',
     }
-    return Response(body, headers=headers)
+    return StreamingResponse(body, headers=headers, media_type=content_type)
 
 
 @app.post("/exports/{session_id}/restore")
-def restore_export(session_id: str):
+async def restore_export(session_id: str):
     try:
-        exported = persistence.load_export(session_id, settings.storage_dir)
+        exported = await asyncio.to_thread(persistence.load_export, session_id, settings.storage_dir)
     except FileNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
     restored_session = sessions.restore(exported)
-    metrics.counter("exports.restore").inc()
+    _EXPORTS_RESTORE.inc()
 
     return {
         "session_id": restored_session.session_id,
@@ -511,7 +933,7 @@ def restore_export(session_id: str):
 
 
 @app.post("/exports/retention/sweep")
-def sweep_exports(request: RetentionSweepRequest):
+async def sweep_exports(request: RetentionSweepRequest):
     retention_days = request.retention_days or settings.export_retention_days
     if retention_days is None:
         raise HTTPException(
@@ -519,18 +941,18 @@ def sweep_exports(request: RetentionSweepRequest):
             detail="retention sweeping disabled; set retention_days to enable",
         )
 
-    removed = persistence.prune_exports(settings.storage_dir, retention_days)
-    metrics.counter("exports.prune").inc()
+    removed = await asyncio.to_thread(persistence.prune_exports, settings.storage_dir, retention_days)
+    _EXPORTS_PRUNE.inc()
     return {"removed": removed, "retention_days": retention_days}
 
 
 @app.delete("/sessions/{session_id}")
-def delete_session(session_id: str):
+async def delete_session(session_id: str):
     session_present = sessions.exists(session_id)
     if session_present:
         sessions.delete(session_id)
-    export_removed = persistence.delete_export(session_id, settings.storage_dir)
-    metrics.counter("sessions.delete").inc()
+    export_removed = await asyncio.to_thread(persistence.delete_export, session_id, settings.storage_dir)
+    _SESSIONS_DELETE.inc()
     return {
         "session_id": session_id,
         "session_removed": session_present,
@@ -539,12 +961,12 @@ def delete_session(session_id: str):
 
 
 @app.get("/sessions/{session_id}")
-def get_session(session_id: str):
+async def get_session(session_id: str):
     try:
         session = sessions.get(session_id)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    metrics.counter("sessions.get").inc()
+    _SESSIONS_GET.inc()
     return {
         "session_id": session.session_id,
         "segments": session.serialized_segments(),
@@ -554,7 +976,7 @@ def get_session(session_id: str):
 
 
 @app.get("/sessions/{session_id}/search")
-def search_session(session_id: str, query: str | None = None):
+async def search_session(session_id: str, query: str | None = None):
     term = (query or "").strip()
     if not term:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="query is required")
@@ -564,7 +986,7 @@ def search_session(session_id: str, query: str | None = None):
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
 
-    metrics.counter("sessions.search").inc()
+    _SESSIONS_SEARCH.inc()
     return {
         "session_id": session_id,
         "query": term,
@@ -579,7 +1001,7 @@ def update_session_metadata(session_id: str, request: SessionMetadataRequest):
         session = sessions.update_metadata(session_id, title=request.title, agenda=request.agenda)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    metrics.counter("sessions.metadata").inc()
+    _SESSIONS_METADATA.inc()
     return {
         "session_id": session.session_id,
         "metadata": session.metadata_view(),
@@ -593,7 +1015,7 @@ def label_speaker(session_id: str, request: SpeakerLabelRequest):
         session = sessions.label(session_id, request.speaker_id, request.display_name)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    metrics.counter("sessions.label").inc()
+    _SESSIONS_LABEL.inc()
     return {
         "session_id": session.session_id,
         "speaker": request.speaker_id,
@@ -608,7 +1030,7 @@ def forget_speaker(session_id: str, request: ForgetSpeakerRequest):
         session, scrubbed = sessions.forget(session_id, request.speaker_id, request.redaction_text)
     except KeyError as exc:  # pragma: no cover - exercised via API tests
         _translate_session_error(exc)
-    metrics.counter("sessions.forget").inc()
+    _SESSIONS_FORGET.inc()
     return {
         "session_id": session.session_id,
         "speaker": request.speaker_id,
@@ -618,21 +1040,21 @@ def forget_speaker(session_id: str, request: ForgetSpeakerRequest):
 
 
 @app.post("/summarize")
-def summarize(request: SummarizeRequest):
-    summary = get_summarizer().summarize(request.transcript, max_points=request.max_points)
-    metrics.counter("summarize.calls").inc()
+async def summarize(request: SummarizeRequest):
+    summary = await _run_model(get_summarizer().summarize, request.transcript, max_points=request.max_points)
+    _SUMMARIZE_CALLS.inc()
     return {"highlight": summary.highlight, "bullet_points": summary.bullet_points}
 
 
 @app.post("/tts")
-def synthesize(request: TtsRequest):
-    audio = get_tts().synthesize(request.text, voice=request.voice)
-    metrics.counter("tts.calls").inc()
+async def synthesize(request: TtsRequest):
+    audio = await _run_model(get_tts().synthesize, request.text, voice=request.voice)
+    _TTS_CALLS.inc()
     return {"encoding": audio.encoding, "payload_b64": audio.as_base64()}
 
 
 @app.get("/metrics")
-def metric_snapshot():
+async def metric_snapshot():
     """Expose collected counters for lightweight observability."""
 
     return {"counters": metrics.snapshot()}
@@ -648,7 +1070,7 @@ def support_bundle(include_exports: bool = True):
         include_exports=include_exports,
     )
 
-    metrics.counter("support.bundle").inc()
+    _SUPPORT_BUNDLE.inc()
     headers = {
         "Content-Type": "application/zip",
         "Content-Disposition": "attachment; filename=diagnostics.zip",
@@ -7,12 +7,67 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional
+from functools import lru_cache
+from math import gcd
+from typing import Optional, Tuple
 
 import numpy as np
 
 logger = logging.getLogger(__name__)
 
+RNNOISE_SAMPLE_RATE = 48000
+NOISE_GATE_THRESHOLD = 0.01
+NOISE_GATE_ATTENUATION = 0.1
+
+def _noise_gate_numpy(x, threshold, attenuation):
+    x[np.abs(x) <= threshold] *= attenuation
+
+
+@lru_cache(maxsize=None)
+def _noise_gate_kernel():
+    """Return the in-place gate, a single-pass numba kernel when numba is installed.
+
+    numba is imported and the kernel compiled on first use, so importing this
+    module (or a service that never suppresses noise) pays neither cost.
+    """
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - numba is not a hard dependency
+        return _noise_gate_numpy
+
+    @numba.njit(cache=True)
+    def _noise_gate(x, threshold, attenuation):  # pragma: no cover - compiled
+        for i in range(x.shape[0]):
+            v = x[i]
+            if abs(v) <= threshold:
+                x[i] = v * attenuation
+
+    return _noise_gate
+
+
+@lru_cache(maxsize=None)
+def _polyphase_filter(src_rate: int, dst_rate: int) -> Tuple[int, int, np.ndarray]:
+    """Return ``(up, down, fir)`` for resampling ``src_rate`` -> ``dst_rate``.
+
+    The FIR matches scipy's own ``resample_poly`` default (Kaiser, beta 5.0);
+    designing it once per rate pair keeps ``firwin`` off the request path.
+    """
+    from scipy import signal
+
+    g = gcd(src_rate, dst_rate)
+    up, down = dst_rate // g, src_rate // g
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    fir = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=("kaiser", 5.0))
+    return up, down, fir
+
+
+def _resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    from scipy import signal
+
+    up, down, fir = _polyphase_filter(src_rate, dst_rate)
+    return signal.resample_poly(audio, up, down, window=fir).astype(np.float32, copy=False)
+
 
 class NoiseSuppressor:
     """Noise suppression service.
@@ -32,6 +87,9 @@ class NoiseSuppressor:
         """
         self.method = method
         self.rnnoise_model = None
+        self._rnnoise_input_name: Optional[str] = None
+        self._rnnoise_batched = False
+        self._sos_cache: dict[int, np.ndarray] = {}
         self.webrtc_apm = None
         self._initialize_suppressor()
     
@@ -46,6 +104,12 @@ class NoiseSuppressor:
                 model_path = os.getenv("RNNOISE_MODEL_PATH", "models/rnnoise.onnx")
                 if os.path.exists(model_path):
                     self.rnnoise_model = ort.InferenceSession(model_path)
+                    model_input = self.rnnoise_model.get_inputs()[0]
+                    self._rnnoise_input_name = model_input.name
+                    # Exported models with a symbolic/None leading dim accept
+                    # every frame in one run; a fixed (1, 480) input does not.
+                    batch_dim = model_input.shape[0] if model_input.shape else 1
+                    self._rnnoise_batched = not isinstance(batch_dim, int) or batch_dim != 1
                     logger.info("RNNoise model loaded")
                     if self.method == "rnnoise":
                         return
@@ -83,14 +147,13 @@ class NoiseSuppressor:
             return audio
         
         # Ensure float32 format
-        if audio.dtype != np.float32:
-            audio = audio.astype(np.float32)
+        audio = audio.astype(np.float32, copy=False)
         
-        # Normalize to [-1, 1] if needed
-        if audio.max() > 1.0 or audio.min() < -1.0:
-            max_val = max(abs(audio.max()), abs(audio.min()))
-            if max_val > 0:
-                audio = audio / max_val
+        # Normalize to [-1, 1] if needed: one pass for the peak
+        peak = float(np.abs(audio).max())
+        if peak > 1.0:
+            # Divide into a fresh buffer so the caller's array is left untouched
+            audio = np.divide(audio, peak, dtype=np.float32)
         
         if self.rnnoise_model:
             return self._suppress_rnnoise(audio, sample_rate)
@@ -101,42 +164,36 @@ class NoiseSuppressor:
         """Apply RNNoise suppression."""
         try:
             # RNNoise expects 48000 Hz, so we need to resample if needed
-            if sample_rate != 48000:
-                from scipy import signal
-                num_samples = int(len(audio) * 48000 / sample_rate)
-                audio_resampled = signal.resample(audio, num_samples)
+            if sample_rate != RNNOISE_SAMPLE_RATE:
+                audio_resampled = _resample(audio, sample_rate, RNNOISE_SAMPLE_RATE)
             else:
                 audio_resampled = audio
             
             # RNNoise processes in frames of 480 samples (10ms at 48kHz)
             frame_size = 480
-            output_frames = []
-            
-            for i in range(0, len(audio_resampled), frame_size):
-                frame = audio_resampled[i:i + frame_size]
-                if len(frame) < frame_size:
-                    # Pad last frame
-                    frame = np.pad(frame, (0, frame_size - len(frame)), mode='constant')
-                
-                # Prepare input (RNNoise expects specific input shape)
-                input_data = frame.reshape(1, -1).astype(np.float32)
-                
-                # Run inference
-                input_name = self.rnnoise_model.get_inputs()[0].name
-                output = self.rnnoise_model.run(None, {input_name: input_data})
-                
-                # Extract output
-                denoised_frame = output[0].flatten()
-                output_frames.append(denoised_frame)
+            resampled_len = len(audio_resampled)
+            n_frames = -(-resampled_len // frame_size)
+            if resampled_len == n_frames * frame_size:
+                # Whole frames: a reshaped view, no copy
+                frames = audio_resampled.reshape(n_frames, frame_size).astype(np.float32, copy=False)
+            else:
+                # One copy into a zeroed frame matrix; the zero tail pads the last frame
+                frames = np.zeros((n_frames, frame_size), dtype=np.float32)
+                frames.reshape(-1)[:resampled_len] = audio_resampled
             
-            # Concatenate frames
-            denoised = np.concatenate(output_frames)
+            input_name = self._rnnoise_input_name
+            if self._rnnoise_batched:
+                # One ORT dispatch for the whole clip
+                denoised = self.rnnoise_model.run(None, {input_name: frames})[0]
+            else:
+                denoised = np.empty_like(frames)
+                for i in range(n_frames):
+                    denoised[i] = self.rnnoise_model.run(None, {input_name: frames[i:i + 1]})[0].reshape(-1)
+            denoised = denoised.reshape(-1)[:resampled_len]
             
             # Resample back to original sample rate if needed
-            if sample_rate != 48000:
-                from scipy import signal
-                num_samples = int(len(denoised) * sample_rate / 48000)
-                denoised = signal.resample(denoised, num_samples)
+            if sample_rate != RNNOISE_SAMPLE_RATE:
+                denoised = _resample(denoised, RNNOISE_SAMPLE_RATE, sample_rate)
             
             return denoised[:len(audio)]  # Trim to original length
         except Exception as e:
@@ -150,20 +207,19 @@ class NoiseSuppressor:
             
             # High-pass filter to remove low-frequency noise
             # Cutoff frequency: 80 Hz (removes rumble, but keeps speech)
-            nyquist = sample_rate / 2
-            cutoff = 80.0 / nyquist
-            
-            # Design Butterworth high-pass filter
-            b, a = signal.butter(4, cutoff, btype='high')
+            sos = self._sos_cache.get(sample_rate)
+            if sos is None:
+                # Design Butterworth high-pass filter once per sample rate
+                nyquist = sample_rate / 2
+                sos = signal.butter(4, 80.0 / nyquist, btype='high', output='sos')
+                self._sos_cache[sample_rate] = sos
             
             # Apply filter
-            filtered = signal.filtfilt(b, a, audio)
+            filtered = signal.sosfiltfilt(sos, audio)
             
             # Optional: spectral subtraction (simple noise gate)
-            # Reduce very quiet parts
-            threshold = 0.01
-            mask = np.abs(filtered) > threshold
-            filtered = filtered * mask + filtered * 0.1 * (1 - mask)
+            # Reduce very quiet parts, in place on the filtfilt output
+            _noise_gate_kernel()(filtered, NOISE_GATE_THRESHOLD, NOISE_GATE_ATTENUATION)
             
             return filtered
         except ImportError:
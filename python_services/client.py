@@ -1,20 +1,29 @@
 """Lightweight HTTP client for the meeting assistant service scaffold.
 
 The client keeps dependencies minimal by defaulting to the standard library
-for HTTP requests, while allowing a drop-in HTTP client (such as the built-in
-`fastapi.TestClient`) to be supplied for in-process testing. This provides an
-easy way for the desktop shell or other integrations to exercise the scaffold
-without reimplementing request plumbing.
+for HTTP requests (reusing keep-alive connections), while allowing a drop-in
+HTTP client (such as the built-in `fastapi.TestClient`) to be supplied for
+in-process testing. This provides an easy way for the desktop shell or other
+integrations to exercise the scaffold without reimplementing request plumbing.
 """
 from __future__ import annotations
 
+import http.client
 import json
-import urllib.error
+import threading
 import urllib.parse
-import urllib.request
 import uuid
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional
+from functools import cached_property
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+try:  # Optional fast codec; orjson reads and writes bytes directly.
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # pragma: no cover - depends on the installed extras
+    _json_loads = json.loads
+
+    def _json_dumps(payload: Any) -> bytes:
+        return json.dumps(payload).encode("utf-8")
 
 
 class ServiceError(RuntimeError):
@@ -24,55 +33,138 @@ class ServiceError(RuntimeError):
 @dataclass
 class _Response:
     status_code: int
-    text: str
     content: bytes = b""
 
+    @cached_property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
     def json(self) -> Any:
-        if not self.text:
+        if not self.content:
             return {}
-        return json.loads(self.text)
+        # Parse the raw body directly; no intermediate str decode.
+        return _json_loads(self.content)
 
 
-class _UrllibClient:
-    """Simple HTTP client backed by urllib to avoid third-party deps."""
+class _PooledClient:
+    """Keep-alive HTTP client over ``http.client`` to avoid third-party deps.
+
+    Each thread keeps one persistent connection per scheme/host, so repeated
+    calls skip the TCP (and TLS) handshake that a fresh ``urlopen`` pays.
+    """
+
+    # Raised when the server dropped an idle keep-alive connection.
+    _STALE_ERRORS = (http.client.RemoteDisconnected, http.client.CannotSendRequest, ConnectionResetError, BrokenPipeError)
+    # A request that failed after it was sent may already have been processed,
+    # so only these are replayed when the response never arrives.
+    _IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self, timeout: float = 30.0):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: list[http.client.HTTPConnection] = []
+
+    def _pool(self) -> Dict[Tuple[str, str], http.client.HTTPConnection]:
+        pool = getattr(self._local, "pool", None)
+        if pool is None:
+            pool = self._local.pool = {}
+        return pool
+
+    def _connect(self, scheme: str, netloc: str) -> http.client.HTTPConnection:
+        factory = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = factory(netloc, timeout=self.timeout)
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def _discard(self, key: Tuple[str, str]) -> None:
+        conn = self._pool().pop(key, None)
+        if conn is not None:
+            conn.close()
+            with self._lock:
+                if conn in self._connections:
+                    self._connections.remove(conn)
 
     def request(self, method: str, url: str, *, headers: Dict[str, str] | None = None, json_body: Any = None, params: Dict[str, Any] | None = None) -> _Response:
-        headers = headers or {}
+        headers = dict(headers or {})
         if json_body is not None:
             headers["content-type"] = "application/json"
-            data = json.dumps(json_body).encode("utf-8")
+            data = _json_dumps(json_body)
         else:
             data = None
 
+        parts = urllib.parse.urlsplit(url)
+        target = parts.path or "/"
+        query = parts.query
         if params:
-            query = urllib.parse.urlencode(params, doseq=True)
-            url = f"{url}?{query}"
-
-        req = urllib.request.Request(url, data=data, headers=headers, method=method.upper())
-        try:
-            with urllib.request.urlopen(req) as resp:
+            extra = urllib.parse.urlencode(params, doseq=True)
+            query = f"{query}&{extra}" if query else extra
+        if query:
+            target = f"{target}?{query}"
+
+        method = method.upper()
+        key = (parts.scheme, parts.netloc)
+        pool = self._pool()
+        while True:
+            conn = pool.get(key)
+            reused = conn is not None
+            if conn is None:
+                conn = pool[key] = self._connect(*key)
+            sent = False
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
                 content = resp.read()
-                body = content.decode("utf-8")
-                return _Response(status_code=resp.getcode(), text=body, content=content)
-        except urllib.error.HTTPError as exc:  # pragma: no cover - exercised via client tests
-            body = exc.read().decode("utf-8")
-            return _Response(status_code=exc.code, text=body)
+            except self._STALE_ERRORS:
+                self._discard(key)
+                if reused and (not sent or method in self._IDEMPOTENT_METHODS):
+                    # The server closed the idle connection; retry once on a fresh one.
+                    continue
+                raise
+            except Exception:
+                self._discard(key)
+                raise
+            if resp.will_close:
+                self._discard(key)
+            return _Response(status_code=resp.status, content=content)
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
 
 
 class MeetingAssistantClient:
     """Convenience wrapper over the REST scaffold.
 
     Usage:
-        client = MeetingAssistantClient("http://localhost:8000", api_key="secret")
-        session = client.create_session(title="Weekly Sync")
-        client.append_transcript(session["session_id"], "Hello team")
-        summary = client.get_summary(session["session_id"])
+        with MeetingAssistantClient("http://localhost:8000", api_key="secret") as client:
+            session = client.create_session(title="Weekly Sync")
+            client.append_transcript(session["session_id"], "Hello team")
+            summary = client.get_summary(session["session_id"])
     """
 
     def __init__(self, base_url: str, api_key: str | None = None, http_client: Any | None = None):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
-        self.http = http_client or _UrllibClient()
+        self._owns_http = http_client is None
+        self.http = http_client or _PooledClient()
+
+    def close(self) -> None:
+        """Release pooled connections held by the default HTTP backend."""
+
+        if self._owns_http:
+            self.http.close()
+
+    def __enter__(self) -> "MeetingAssistantClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     # Public API helpers -------------------------------------------------
     def health(self) -> Dict[str, Any]:
@@ -131,8 +223,7 @@ class MeetingAssistantClient:
 
     def download_support_bundle(self, include_exports: bool = True) -> bytes:
         params = {"include_exports": str(include_exports).lower()}
-        response = self._request("GET", "/support/bundle", params=params)
-        return response.content or response.text.encode("utf-8")
+        return self._request("GET", "/support/bundle", params=params).content
 
     def restore_export(self, session_id: str) -> Dict[str, Any]:
         return self._post(f"/exports/{session_id}/restore", {})
@@ -171,22 +262,17 @@ class MeetingAssistantClient:
             response = self.http.request(method, url_with_params, **kwargs)
 
         status = getattr(response, "status_code", 0)
-        raw_text = getattr(response, "text", None)
-        raw_content = getattr(response, "content", b"")
-        if raw_text is None:
-            content = getattr(response, "content", "")
-            if isinstance(content, bytes):
-                try:
-                    raw_text = content.decode("utf-8")
-                except UnicodeDecodeError:
-                    raw_text = ""
-                raw_content = content
-            elif isinstance(content, str):
-                raw_text = content
+        content = getattr(response, "content", None)
+        if not isinstance(content, bytes):
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            elif content is None:
+                content = (getattr(response, "text", None) or "").encode("utf-8")
             else:
-                raw_text = json.dumps(content)
+                # In-process clients may hand back the decoded payload itself.
+                content = json.dumps(content).encode("utf-8")
 
-        normalized = _Response(status_code=status, text=raw_text, content=raw_content)
+        normalized = _Response(status_code=status, content=content)
         if normalized.status_code >= 400:
             raise ServiceError(f"request failed ({normalized.status_code}): {normalized.text}")
         return normalized
@@ -11,6 +11,34 @@ import logging
 import os
 from dataclasses import dataclass
 
+_TRUTHY = frozenset({"1", "true", "t", "yes", "y"})
+_FALSY = frozenset({"0", "false", "f", "no", "n"})
+_DISABLED = frozenset({"none", "", "-1"})
+
+
+def _as_bool(value: str, default: bool) -> bool:
+    lowered = value.lower()
+    if lowered in _TRUTHY:
+        return True
+    if lowered in _FALSY:
+        return False
+    return default
+
+
+def _as_int(value: str | None, default: int | None) -> int | None:
+    if value is None:
+        return default
+    if value.lower() in _DISABLED:
+        return None
+    return int(value)
+
+
+def _as_list(value: str | None, default: list[str]) -> list[str]:
+    if value is None:
+        return default
+    parsed = [item.strip() for item in value.split(",") if item.strip()]
+    return parsed or default
+
 
 @dataclass
 class ServiceSettings:
@@ -24,48 +52,36 @@ class ServiceSettings:
     export_retention_days: int | None = 30
     allowed_origins: list[str] = None  # type: ignore[assignment]
     max_requests_per_minute: int | None = None
+    workers: int = 1
+    max_batch_size: int = 16
+    batch_wait_ms: float = 5.0
+    inference_threads: int = 4
+    max_body_bytes: int | None = 16 * 1024 * 1024
 
     @classmethod
     def from_env(cls) -> "ServiceSettings":
         """Load settings from environment variables with safe defaults."""
 
-        def as_bool(value: str, default: bool) -> bool:
-            truthy = {"1", "true", "t", "yes", "y"}
-            falsy = {"0", "false", "f", "no", "n"}
-            if value.lower() in truthy:
-                return True
-            if value.lower() in falsy:
-                return False
-            return default
-
-        def as_int(value: str | None, default: int | None) -> int | None:
-            if value is None:
-                return default
-            if value.lower() in {"none", "", "-1"}:
-                return None
-            return int(value)
-
-        def as_list(value: str | None, default: list[str]) -> list[str]:
-            if value is None:
-                return default
-            parsed = [item.strip() for item in value.split(",") if item.strip()]
-            return parsed or default
-
         return cls(
             host=os.getenv("PY_SERVICES_HOST", cls.host),
             port=int(os.getenv("PY_SERVICES_PORT", cls.port)),
-            reload=as_bool(os.getenv("PY_SERVICES_RELOAD", str(cls.reload)), cls.reload),
+            reload=_as_bool(os.getenv("PY_SERVICES_RELOAD", str(cls.reload)), cls.reload),
             log_level=os.getenv("PY_SERVICES_LOG_LEVEL", cls.log_level),
             api_key=os.getenv("PY_SERVICES_API_KEY"),
             request_id_header=os.getenv("PY_SERVICES_REQUEST_ID_HEADER", cls.request_id_header),
             storage_dir=os.getenv("PY_SERVICES_STORAGE_DIR", cls.storage_dir),
-            export_retention_days=as_int(
+            export_retention_days=_as_int(
                 os.getenv("PY_SERVICES_EXPORT_RETENTION_DAYS"), cls.export_retention_days
             ),
-            allowed_origins=as_list(os.getenv("PY_SERVICES_ALLOWED_ORIGINS"), ["*"]),
-            max_requests_per_minute=as_int(
+            allowed_origins=_as_list(os.getenv("PY_SERVICES_ALLOWED_ORIGINS"), ["*"]),
+            max_requests_per_minute=_as_int(
                 os.getenv("PY_SERVICES_MAX_REQUESTS_PER_MINUTE"), cls.max_requests_per_minute
             ),
+            workers=int(os.getenv("PY_SERVICES_WORKERS", cls.workers)),
+            max_batch_size=int(os.getenv("PY_SERVICES_MAX_BATCH_SIZE", cls.max_batch_size)),
+            batch_wait_ms=float(os.getenv("PY_SERVICES_BATCH_WAIT_MS", cls.batch_wait_ms)),
+            inference_threads=int(os.getenv("PY_SERVICES_INFERENCE_THREADS", cls.inference_threads)),
+            max_body_bytes=_as_int(os.getenv("PY_SERVICES_MAX_BODY_BYTES"), cls.max_body_bytes),
         )
 
 
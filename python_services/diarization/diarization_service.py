@@ -8,7 +8,10 @@ from __future__ import annotations
 import hashlib
 import logging
 import os
+from bisect import bisect_left
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Tuple
 
 from python_services.stt.whisper_service import Transcript, TranscriptSegment
@@ -16,6 +19,20 @@ from python_services.stt.whisper_service import Transcript, TranscriptSegment
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _speaker_id(text: str) -> str:
+    # Only a stable bucket id is needed, not a cryptographic digest; a
+    # 4-byte BLAKE2b is much cheaper than truncating a full SHA-256. Short
+    # recurring utterances ("baleh", "okay") hit the cache instead.
+    return "speaker-" + hashlib.blake2b(text.encode("utf-8"), digest_size=4).hexdigest()
+
+
+def _speaker_ids(texts: List[str]) -> Dict[str, str]:
+    """Speaker id for each distinct non-empty text, hashed once per call."""
+    speaker_id = _speaker_id
+    return {text: speaker_id(text) for text in set(texts) if text}
+
+
 @dataclass
 class DiarizedSegment:
     speaker: str
@@ -24,6 +41,79 @@ class DiarizedSegment:
     end: float = 0.0
     confidence: float = 1.0
 
+    def asdict(self) -> dict:
+        return {
+            "speaker": self.speaker,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "confidence": self.confidence,
+        }
+
+
+@dataclass
+class DiarizedColumns:
+    """Diarization output stored column-wise: one list per field, aligned by index.
+
+    Lets callers that only serialize the result skip building a
+    ``DiarizedSegment`` per segment.
+    """
+
+    speakers: List[str]
+    texts: List[str]
+    starts: List[float]
+    ends: List[float]
+    confidences: List[float]
+
+    def __len__(self) -> int:
+        return len(self.speakers)
+
+    def asdicts(self) -> List[dict]:
+        return [
+            {"speaker": speaker, "text": text, "start": start, "end": end, "confidence": confidence}
+            for speaker, text, start, end, confidence in zip(
+                self.speakers, self.texts, self.starts, self.ends, self.confidences
+            )
+        ]
+
+
+class _TurnIndex:
+    """Speaker turns sorted by start time, with the parallel start list for bisecting."""
+
+    __slots__ = ("turns", "starts", "longest", "labels", "_arrays")
+
+    def __init__(self, turns: List[Tuple[float, float, str]]):
+        self.turns = turns
+        self.starts = [turn[0] for turn in turns]
+        self.longest = max((turn[1] - turn[0] for turn in turns), default=0.0)
+        # Speaker labels in order of first appearance; column order of ``arrays``.
+        self.labels = list(dict.fromkeys(turn[2] for turn in turns))
+        self._arrays = None
+
+    def arrays(self):
+        """``(starts, ends, codes, onehot)`` NumPy views of the turns, built on first use."""
+        if self._arrays is None:
+            import numpy as np
+            column = {label: index for index, label in enumerate(self.labels)}
+            codes = np.fromiter((column[turn[2]] for turn in self.turns), dtype=np.intp, count=len(self.turns))
+            onehot = np.zeros((len(self.turns), len(self.labels)))
+            onehot[np.arange(len(self.turns)), codes] = 1.0
+            self._arrays = (
+                np.asarray(self.starts, dtype=np.float64),
+                np.fromiter((turn[1] for turn in self.turns), dtype=np.float64, count=len(self.turns)),
+                codes,
+                onehot,
+            )
+        return self._arrays
+
+
+# Segments per broadcast block in ``_assign_speakers``. Small enough that the
+# block's turn window stays narrow, large enough to amortize the NumPy calls.
+_ASSIGN_BLOCK = 64
+
+# Audio files whose pipeline output is kept for re-diarization.
+_TURN_CACHE_SIZE = 8
+
 
 class DiarizationService:
     """Speaker diarization service.
@@ -36,7 +126,14 @@ class DiarizationService:
         self.use_pyannote = use_pyannote
         self.diarization_pipeline = None
         self.embedding_model = None
-        self.speaker_embeddings: Dict[str, List] = {}  # speaker_id -> list of embeddings
+        self.speaker_embeddings: Dict[str, List] = {}  # speaker_id -> list of unit-norm embeddings
+        # All enrolled embeddings stacked row-wise with their speaker ids;
+        # rebuilt lazily after enrollment changes.
+        self._embedding_matrix = None
+        self._embedding_labels: List[str] = []
+        # (path, mtime_ns, size) -> speaker turns, so re-diarizing a file skips the pipeline
+        self._turn_cache: "OrderedDict[Tuple[str, int, int], _TurnIndex]" = OrderedDict()
+        self.device = "cpu"
         self._initialize_models()
     
     def _initialize_models(self):
@@ -62,6 +159,14 @@ class DiarizationService:
                 use_auth_token=hf_token
             )
             
+            # Segmentation and embedding nets run on the GPU when there is one;
+            # clustering stays on the CPU either way.
+            import torch
+            self.device = self._resolve_device()
+            if self.device != "cpu":
+                self.diarization_pipeline.to(torch.device(self.device))
+                logger.info(f"Diarization pipeline moved to {self.device}")
+            
             # Try to load embedding model for speaker identification
             try:
                 from pyannote.audio import Model
@@ -69,6 +174,8 @@ class DiarizationService:
                     "pyannote/embedding",
                     use_auth_token=hf_token
                 )
+                if self.device != "cpu":
+                    self.embedding_model.to(torch.device(self.device))
                 logger.info("Speaker embedding model loaded")
             except Exception as e:
                 logger.warning(f"Could not load embedding model: {e}")
@@ -82,6 +189,17 @@ class DiarizationService:
             logger.error(f"Error loading pyannote.audio: {e}", exc_info=True)
             self.use_pyannote = False
     
+    def _resolve_device(self) -> str:
+        """Pick the torch device: ``PY_SERVICES_DIARIZATION_DEVICE`` wins, else CUDA when available."""
+        override = os.getenv("PY_SERVICES_DIARIZATION_DEVICE")
+        if override:
+            return override
+        try:
+            import torch
+            return "cuda" if torch.cuda.is_available() else "cpu"
+        except ImportError:
+            return "cpu"
+    
     def diarize(self, transcript: Transcript, audio_path: Optional[str] = None) -> List[DiarizedSegment]:
         """
         Perform speaker diarization on transcript.
@@ -99,73 +217,163 @@ class DiarizationService:
         # Fallback to simple text-based clustering
         return self._diarize_simple(transcript)
     
+    def diarize_batch(self, transcripts: List[Transcript]) -> List[List[DiarizedSegment]]:
+        """Diarize several transcripts without audio, preserving input order."""
+        return [self._diarize_simple(transcript) for transcript in transcripts]
+    
+    def diarize_columns(self, transcript: Transcript) -> DiarizedColumns:
+        """Text-only diarization returned as parallel columns instead of segment objects."""
+        segments = transcript.segments
+        texts = [segment.text for segment in segments]
+        speaker_ids = _speaker_ids(texts)
+        return DiarizedColumns(
+            speakers=[speaker_ids.get(text, "unknown") for text in texts],
+            texts=texts,
+            starts=[segment.start for segment in segments],
+            ends=[segment.end for segment in segments],
+            confidences=[segment.confidence for segment in segments],
+        )
+    
+    def diarize_columns_batch(self, transcripts: List[Transcript]) -> List[DiarizedColumns]:
+        """Column-form counterpart of :meth:`diarize_batch`, preserving input order."""
+        return [self.diarize_columns(transcript) for transcript in transcripts]
+    
     def _diarize_with_pyannote(self, transcript: Transcript, audio_path: str) -> List[DiarizedSegment]:
         """Diarize using pyannote.audio."""
         try:
-            # Run diarization pipeline
-            diarization = self.diarization_pipeline(audio_path)
-            
-            # Map transcript segments to diarization results
-            diarized_segments = []
+            # Map transcript segments to diarization results, all segments at once
+            segments = transcript.segments
+            speakers = self._assign_speakers(
+                [seg.start for seg in segments], [seg.end for seg in segments], self._turns_for(audio_path)
+            )
             
-            for seg in transcript.segments:
-                # Find overlapping diarization segments
-                speaker = self._find_speaker_for_segment(seg.start, seg.end, diarization)
-                
-                diarized_segments.append(DiarizedSegment(
+            return [
+                DiarizedSegment(
                     speaker=speaker,
                     text=seg.text,
                     start=seg.start,
                     end=seg.end,
                     confidence=seg.confidence
-                ))
-            
-            return diarized_segments
+                )
+                for seg, speaker in zip(segments, speakers)
+            ]
         except Exception as e:
             logger.error(f"Error in pyannote diarization: {e}", exc_info=True)
             return self._diarize_simple(transcript)
     
-    def _find_speaker_for_segment(self, start: float, end: float, diarization) -> str:
+    def _turns_for(self, audio_path: str) -> "_TurnIndex":
+        """Run the pipeline on ``audio_path``, reusing turns while the file is unchanged."""
+        stat = os.stat(audio_path)
+        key = (audio_path, stat.st_mtime_ns, stat.st_size)
+        turns = self._turn_cache.get(key)
+        if turns is None:
+            turns = self._index_turns(self.diarization_pipeline(self._load_audio(audio_path)))
+            self._turn_cache[key] = turns
+            if len(self._turn_cache) > _TURN_CACHE_SIZE:
+                self._turn_cache.popitem(last=False)
+        else:
+            self._turn_cache.move_to_end(key)
+        return turns
+    
+    def _load_audio(self, audio_path: str):
+        """Decode audio up front as a waveform on the pipeline's device.
+        
+        Handing pyannote a path makes it decode and resample on a single CPU
+        core while the GPU idles; a preloaded tensor lets resampling run on
+        ``self.device``. Falls back to the path when torchaudio is missing.
+        """
+        try:
+            import torchaudio
+        except ImportError:
+            return audio_path
+        waveform, sample_rate = torchaudio.load(audio_path)
+        return {"waveform": waveform.to(self.device), "sample_rate": sample_rate}
+    
+    def _index_turns(self, diarization) -> "_TurnIndex":
+        """Sort the pipeline's speaker turns once for repeated segment lookups."""
+        turns = sorted(
+            ((turn.start, turn.end, speaker) for turn, _, speaker in diarization.itertracks(yield_label=True)),
+            key=lambda item: item[0],
+        )
+        return _TurnIndex(turns)
+    
+    def _find_speaker_for_segment(self, start: float, end: float, turns: "_TurnIndex") -> str:
         """Find the dominant speaker for a time segment."""
-        # Get all speakers active during this segment
-        speakers_in_segment = {}
+        # Only turns starting before ``end`` and no earlier than ``start`` minus
+        # the longest turn can overlap, so bisect to that window.
+        starts = turns.starts
+        lo = bisect_left(starts, start - turns.longest)
+        hi = bisect_left(starts, end, lo)
         
-        for turn, _, speaker in diarization.itertracks(yield_label=True):
+        speakers_in_segment: Dict[str, float] = defaultdict(float)
+        for turn_start, turn_end, speaker in turns.turns[lo:hi]:
             # Check overlap
-            overlap_start = max(start, turn.start)
-            overlap_end = min(end, turn.end)
-            
+            overlap_start = max(start, turn_start)
+            overlap_end = min(end, turn_end)
             if overlap_start < overlap_end:
-                duration = overlap_end - overlap_start
-                if speaker not in speakers_in_segment:
-                    speakers_in_segment[speaker] = 0.0
-                speakers_in_segment[speaker] += duration
+                speakers_in_segment[speaker] += overlap_end - overlap_start
         
         if not speakers_in_segment:
             return "unknown"
         
         # Return speaker with most overlap
-        dominant_speaker = max(speakers_in_segment.items(), key=lambda x: x[1])[0]
-        return dominant_speaker
+        return max(speakers_in_segment.items(), key=lambda x: x[1])[0]
+    
+    def _assign_speakers(self, seg_starts: List[float], seg_ends: List[float], turns: "_TurnIndex") -> List[str]:
+        """Vectorized :meth:`_find_speaker_for_segment` over many segments at once."""
+        import numpy as np
+        
+        speakers = ["unknown"] * len(seg_starts)
+        if not turns.turns:
+            return speakers
+        
+        turn_starts, turn_ends, codes, onehot = turns.arrays()
+        seg_starts = np.asarray(seg_starts, dtype=np.float64)
+        seg_ends = np.asarray(seg_ends, dtype=np.float64)
+        for offset in range(0, len(seg_starts), _ASSIGN_BLOCK):
+            starts = seg_starts[offset:offset + _ASSIGN_BLOCK, None]
+            ends = seg_ends[offset:offset + _ASSIGN_BLOCK, None]
+            # Same window as the scalar lookup, covering the whole block
+            lo = int(np.searchsorted(turn_starts, starts.min() - turns.longest))
+            hi = int(np.searchsorted(turn_starts, ends.max()))
+            if lo >= hi:
+                continue
+            
+            overlap = np.minimum(turn_ends[lo:hi], ends) - np.maximum(turn_starts[lo:hi], starts)
+            np.maximum(overlap, 0.0, out=overlap)
+            totals = overlap @ onehot[lo:hi]
+            
+            # Ties go to the speaker whose overlapping turn comes first, matching
+            # the insertion order the scalar scan's dict would have.
+            first_turn = np.where(overlap > 0, np.arange(lo, hi), hi)
+            first_by_speaker = np.full(totals.shape, hi)
+            block_codes = codes[lo:hi]
+            for column in np.unique(block_codes):
+                first_by_speaker[:, column] = first_turn[:, block_codes == column].min(axis=1)
+            best = totals.max(axis=1, keepdims=True)
+            winners = np.where(totals == best, first_by_speaker, hi + 1).argmin(axis=1)
+            
+            for row in np.flatnonzero(best[:, 0] > 0):
+                speakers[offset + row] = turns.labels[winners[row]]
+        return speakers
     
     def _diarize_simple(self, transcript: Transcript) -> List[DiarizedSegment]:
         """Simple hash-based diarization fallback."""
-        diarized: List[DiarizedSegment] = []
-        for segment in transcript.segments:
-            speaker = self._hash_speaker(segment.text) if segment.text else "unknown"
-            diarized.append(DiarizedSegment(
-                speaker=speaker,
+        speaker_ids = _speaker_ids([segment.text for segment in transcript.segments])
+        return [
+            DiarizedSegment(
+                speaker=speaker_ids.get(segment.text, "unknown"),
                 text=segment.text,
                 start=segment.start,
                 end=segment.end,
                 confidence=segment.confidence
-            ))
-        return diarized
+            )
+            for segment in transcript.segments
+        ]
     
     def _hash_speaker(self, text: str) -> str:
         """Generate speaker ID from text hash."""
-        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
-        return f"speaker-{digest[:8]}"
+        return _speaker_id(text)
     
     def identify_speaker(self, audio_chunk: bytes, sample_rate: int = 16000) -> Optional[str]:
         """
@@ -190,17 +398,16 @@ class DiarizationService:
             if embedding is None:
                 return None
             
-            # Compare with stored embeddings
-            best_match = None
-            best_similarity = 0.0
+            # Compare with every stored embedding in one matrix-vector product
+            matrix = self._stored_embeddings()
+            if matrix is None:
+                return None
             threshold = 0.7  # Similarity threshold
             
-            for speaker_id, stored_embeddings in self.speaker_embeddings.items():
-                for stored_emb in stored_embeddings:
-                    similarity = self._cosine_similarity(embedding, stored_emb)
-                    if similarity > best_similarity:
-                        best_similarity = similarity
-                        best_match = speaker_id
+            similarities = matrix @ self._unit(embedding)
+            best = int(similarities.argmax())
+            best_similarity = float(similarities[best])
+            best_match = self._embedding_labels[best]
             
             if best_similarity >= threshold:
                 return best_match
@@ -220,10 +427,12 @@ class DiarizationService:
             if embedding is not None:
                 if speaker_id not in self.speaker_embeddings:
                     self.speaker_embeddings[speaker_id] = []
-                self.speaker_embeddings[speaker_id].append(embedding)
+                # Normalized once here so identification is a plain dot product
+                self.speaker_embeddings[speaker_id].append(self._unit(embedding))
                 # Keep only last 5 embeddings per speaker
                 if len(self.speaker_embeddings[speaker_id]) > 5:
                     self.speaker_embeddings[speaker_id] = self.speaker_embeddings[speaker_id][-5:]
+                self._embedding_matrix = None
         except Exception as e:
             logger.error(f"Error enrolling speaker: {e}", exc_info=True)
     
@@ -233,12 +442,23 @@ class DiarizationService:
         # For now, return None to indicate not implemented
         return None
     
-    def _cosine_similarity(self, a, b) -> float:
-        """Calculate cosine similarity between two embeddings."""
+    @staticmethod
+    def _unit(embedding):
+        """Embedding as a float32 unit vector (zero vectors stay zero)."""
         import numpy as np
-        dot_product = np.dot(a, b)
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-        return dot_product / (norm_a * norm_b)
+        vector = np.asarray(embedding, dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+    
+    def _stored_embeddings(self):
+        """Enrolled embeddings as one ``(N, D)`` matrix, rows aligned with ``_embedding_labels``."""
+        if self._embedding_matrix is None:
+            import numpy as np
+            labels = [speaker_id for speaker_id, stored in self.speaker_embeddings.items() for _ in stored]
+            if not labels:
+                return None
+            self._embedding_matrix = np.vstack(
+                [vector for stored in self.speaker_embeddings.values() for vector in stored]
+            )
+            self._embedding_labels = labels
+        return self._embedding_matrix
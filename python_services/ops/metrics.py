@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class Counter:
     name: str
     value: int = 0
@@ -19,9 +19,10 @@ class MetricsRegistry:
         self.counters: Dict[str, Counter] = {}
 
     def counter(self, name: str) -> Counter:
-        if name not in self.counters:
-            self.counters[name] = Counter(name=name)
-        return self.counters[name]
+        counter = self.counters.get(name)
+        if counter is None:
+            counter = self.counters[name] = Counter(name=name)
+        return counter
 
     def snapshot(self) -> Dict[str, int]:
         """Return the current counter values as a plain dictionary."""
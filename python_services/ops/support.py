@@ -44,8 +44,17 @@ def _serialize_exports(storage_dir: str, include_exports: bool) -> dict:
         except FileNotFoundError:
             continue
 
-        exports[export_id] = asdict(export)
-        exports[export_id]["created_at"] = export.created_at.isoformat()
+        # Field-by-field rather than dataclasses.asdict: the export's segment
+        # dicts are already built, so nothing needs a recursive deep copy.
+        exports[export_id] = {
+            "session_id": export.session_id,
+            "created_at": export.created_at.isoformat(),
+            "language": export.language,
+            "segments": export.segment_dicts,
+            "summary": asdict(export.summary),
+            "title": export.title,
+            "agenda": export.agenda,
+        }
 
     return exports
 
@@ -7,9 +7,11 @@ later.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from itertools import islice
+from typing import Deque, Dict, List, Sequence, Tuple
 
 from python_services.diarization.diarization_service import DiarizedSegment
 from python_services.storage.manifests import SegmentRecord, SessionExport
@@ -17,6 +19,14 @@ from python_services.summarization.summarizer import Summary
 from python_services.vad.simple_vad import SpeechSpan, detect_speech
 
 
+def buffer_transcript_text(spans: Sequence[SpeechSpan], transcript_hint: str = "buffered audio") -> str:
+    """Build the STT request text describing the detected buffer spans."""
+
+    transcript_text = transcript_hint.strip() or "buffered audio"
+    span_descriptions = [f"buffer {span.start_index}-{span.end_index}" for span in spans]
+    return f"{transcript_text}: {'; '.join(span_descriptions)}"
+
+
 @dataclass
 class Session:
     session_id: str
@@ -26,7 +36,7 @@ class Session:
     agenda: List[str] = field(default_factory=list)
     segments: List[DiarizedSegment] = field(default_factory=list)
     speaker_labels: Dict[str, str] = field(default_factory=dict)
-    audio_buffer: List[float] = field(default_factory=list)
+    audio_buffer: Deque[float] = field(default_factory=deque)
 
     def update_metadata(self, title: str | None = None, agenda: List[str] | None = None) -> None:
         if title is not None:
@@ -55,39 +65,55 @@ class Session:
         scrubbed = 0
         self.speaker_labels.pop(speaker_id, None)
 
-        updated_segments: List[DiarizedSegment] = []
-        for segment in self.segments:
+        # Swap only the matching slots; segments handed to ``append_segments``
+        # may still be referenced by the caller, so they are replaced rather
+        # than mutated.
+        segments = self.segments
+        for index, segment in enumerate(segments):
             if segment.speaker == speaker_id:
                 scrubbed += 1
-                updated_segments.append(DiarizedSegment(speaker=segment.speaker, text=redaction_text))
-            else:
-                updated_segments.append(segment)
+                segments[index] = replace(segment, text=redaction_text)
 
-        self.segments = updated_segments
         return scrubbed
 
     def summary(self, summarizer) -> Summary:
         transcript_text = " ".join(segment.text for segment in self.segments)
         return summarizer.summarize(transcript_text)
 
-    def append_audio(self, samples: List[float], trim_to: int | None = None) -> int:
+    @property
+    def buffered(self) -> int:
+        return len(self.audio_buffer)
+
+    def append_audio(self, samples: Sequence[float], trim_to: int | None = None) -> int:
+        # The deque's maxlen does the trimming: once it matches ``trim_to``,
+        # extend() evicts from the left instead of re-slicing the buffer.
+        limit = trim_to if trim_to is not None and trim_to > 0 else None
+        if self.audio_buffer.maxlen != limit:
+            self.audio_buffer = deque(self.audio_buffer, maxlen=limit)
+        added = len(samples)
+        if limit is not None and added > limit:
+            # Only the tail survives; slicing first skips pushing samples that
+            # would be evicted again within the same extend().
+            samples = samples[-limit:]
         self.audio_buffer.extend(samples)
-
-        if trim_to is not None and trim_to > 0:
-            overflow = len(self.audio_buffer) - trim_to
-            if overflow > 0:
-                self.audio_buffer = self.audio_buffer[overflow:]
-
-        return len(samples)
+        return added
 
     def audio_samples(self, max_samples: int | None = None) -> List[float]:
-        if max_samples is None or max_samples <= 0:
-            return list(self.audio_buffer)
+        buffer = self.audio_buffer
+        if max_samples is None or max_samples <= 0 or max_samples >= len(buffer):
+            return list(buffer)
 
-        return self.audio_buffer[-max_samples:]
+        return list(islice(buffer, len(buffer) - max_samples, None))
 
     def clear_audio(self) -> None:
-        self.audio_buffer = []
+        self.audio_buffer.clear()
+
+    def detach_audio(self) -> Deque[float]:
+        """Hand over the buffered samples and continue in a fresh buffer with the same limit."""
+
+        detached = self.audio_buffer
+        self.audio_buffer = deque(maxlen=detached.maxlen)
+        return detached
 
     def export(self, summarizer) -> SessionExport:
         summary = self.summary(summarizer)
@@ -170,7 +196,7 @@ class SessionStore:
         session.update_metadata(title=title, agenda=agenda)
         return session
 
-    def append_audio(self, session_id: str, samples: List[float], trim_to: int | None = None) -> Session:
+    def append_audio(self, session_id: str, samples: Sequence[float], trim_to: int | None = None) -> Session:
         if session_id not in self._sessions:
             raise KeyError(f"Unknown session {session_id}")
 
@@ -197,8 +223,9 @@ class SessionStore:
         scrubbed = session.forget_speaker(speaker_id, redaction_text)
         return session, scrubbed
 
-    def summary(self, session_id: str, summarizer) -> Summary:
-        return self.get(session_id).summary(summarizer)
+    def summary(self, session_id: str, summarizer) -> Tuple[Session, Summary]:
+        session = self.get(session_id)
+        return session, session.summary(summarizer)
 
     def export(self, session_id: str, summarizer) -> SessionExport:
         return self.get(session_id).export(summarizer)
@@ -206,6 +233,39 @@ class SessionStore:
     def audio_samples(self, session_id: str, max_samples: int | None = None) -> List[float]:
         return self.get(session_id).audio_samples(max_samples=max_samples)
 
+    def audio_view(self, session_id: str, max_samples: int | None = None) -> Tuple[Session, List[float]]:
+        session = self.get(session_id)
+        return session, session.audio_samples(max_samples=max_samples)
+
+    def detect_buffer_speech(
+        self, session_id: str, threshold: float = 0.01, min_run: int = 3
+    ) -> Tuple[Session, List[SpeechSpan]]:
+        session = self.get(session_id)
+        return session, detect_speech(session.audio_buffer, threshold=threshold, min_run=min_run)
+
+    def claim_buffer_speech(
+        self,
+        session_id: str,
+        threshold: float = 0.01,
+        min_run: int = 3,
+        transcript_hint: str = "buffered audio",
+        clear_buffer: bool = False,
+    ) -> Tuple[Session, List[SpeechSpan], str | None]:
+        """Detect speech in the buffer and return the STT request text for it.
+
+        The text is ``None`` when nothing was detected. With ``clear_buffer``
+        the analysed samples are detached right away, so audio appended while
+        the caller transcribes lands in the new buffer instead of being cleared
+        unseen.
+        """
+
+        session, spans = self.detect_buffer_speech(session_id, threshold=threshold, min_run=min_run)
+        if not spans:
+            return session, spans, None
+        if clear_buffer:
+            session.detach_audio()
+        return session, spans, buffer_transcript_text(spans, transcript_hint)
+
     def process_audio_buffer(
         self,
         session_id: str,
@@ -216,25 +276,14 @@ class SessionStore:
         transcript_hint: str = "buffered audio",
         clear_buffer: bool = False,
     ) -> Tuple[Session, List[SpeechSpan], List[str]]:
-        session = self.get(session_id)
-
-        spans = detect_speech(session.audio_buffer, threshold=threshold, min_run=min_run)
-        if not spans:
-            return session, spans, []
-
-        transcript_text = transcript_hint.strip() or "buffered audio"
-        span_descriptions = [f"buffer {span.start_index}-{span.end_index}" for span in spans]
-        transcript = stt_service.transcribe(
-            f"{transcript_text}: {'; '.join(span_descriptions)}", language=session.language
+        session, spans, transcript_text = self.claim_buffer_speech(
+            session_id, threshold=threshold, min_run=min_run, transcript_hint=transcript_hint, clear_buffer=clear_buffer
         )
-        diarized = diarization_service.diarize(transcript)
-        manifest_segments = [DiarizedSegment(speaker=s.speaker, text=s.text) for s in diarized]
-
-        session, new_speakers = self.append(session_id, manifest_segments)
-
-        if clear_buffer:
-            session.clear_audio()
+        if transcript_text is None:
+            return session, spans, []
 
+        transcript = stt_service.transcribe(transcript_text, language=session.language)
+        session, new_speakers = self.append(session_id, diarization_service.diarize(transcript))
         return session, spans, new_speakers
 
     def delete(self, session_id: str) -> None:
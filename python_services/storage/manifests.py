@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from python_services.diarization.diarization_service import DiarizedSegment
 from python_services.summarization.summarizer import Summary
@@ -15,6 +16,9 @@ class SegmentRecord:
     text: str
     speaker_label: Optional[str] = None
 
+    def asdict(self) -> dict:
+        return {"speaker": self.speaker, "text": self.text, "speaker_label": self.speaker_label}
+
 
 @dataclass
 class TranscriptManifest:
@@ -32,6 +36,12 @@ class TranscriptManifest:
             segments=segments,
         )
 
+    @cached_property
+    def segment_dicts(self) -> List[dict]:
+        """Serialized segments, built once per manifest."""
+
+        return [segment.asdict() for segment in self.segments]
+
 
 @dataclass
 class SessionExport:
@@ -45,55 +55,84 @@ class SessionExport:
     title: str | None = None
     agenda: List[str] = field(default_factory=list)
 
+    @cached_property
+    def segment_dicts(self) -> List[dict]:
+        """Serialized segments, built once per export snapshot."""
+
+        return [segment.asdict() for segment in self.segments]
 
-def render_markdown(export: SessionExport) -> str:
-    """Return a Markdown representation of the session export."""
 
+def _markdown_lines(export: SessionExport) -> Iterator[str]:
     header = export.title or f"Session {export.session_id}"
-    lines = [f"# {header}"]
-    lines.append(f"- Session ID: `{export.session_id}`")
-    lines.append(f"- Created: {export.created_at.isoformat()}")
-    lines.append(f"- Language: {export.language}")
+    yield f"# {header}"
+    yield f"- Session ID: `{export.session_id}`"
+    yield f"- Created: {export.created_at.isoformat()}"
+    yield f"- Language: {export.language}"
     if export.agenda:
-        lines.append("- Agenda:")
+        yield "- Agenda:"
         for item in export.agenda:
-            lines.append(f"  - {item}")
+            yield f"  - {item}"
 
-    lines.append("\n## Summary")
-    lines.append(f"**Highlight:** {export.summary.highlight}")
+    yield "\n## Summary"
+    yield f"**Highlight:** {export.summary.highlight}"
     if export.summary.bullet_points:
-        lines.append("\n**Bullet Points:**")
+        yield "\n**Bullet Points:**"
         for bullet in export.summary.bullet_points:
-            lines.append(f"- {bullet}")
+            yield f"- {bullet}"
 
-    lines.append("\n## Timeline")
+    yield "\n## Timeline"
     for segment in export.segments:
         speaker = segment.speaker_label or segment.speaker
-        lines.append(f"- **{speaker}**: {segment.text}")
-
-    return "\n".join(lines)
+        yield f"- **{speaker}**: {segment.text}"
 
 
-def render_text(export: SessionExport) -> str:
-    """Return a plain-text representation of the session export."""
-
-    lines = [f"Session: {export.title or export.session_id}"]
-    lines.append(f"Session ID: {export.session_id}")
-    lines.append(f"Created: {export.created_at.isoformat()}")
-    lines.append(f"Language: {export.language}")
+def _text_lines(export: SessionExport) -> Iterator[str]:
+    yield f"Session: {export.title or export.session_id}"
+    yield f"Session ID: {export.session_id}"
+    yield f"Created: {export.created_at.isoformat()}"
+    yield f"Language: {export.language}"
     if export.agenda:
-        lines.append("Agenda:")
+        yield "Agenda:"
         for item in export.agenda:
-            lines.append(f"- {item}")
+            yield f"- {item}"
 
-    lines.append("\nSummary:")
-    lines.append(export.summary.highlight)
+    yield "\nSummary:"
+    yield export.summary.highlight
     for bullet in export.summary.bullet_points:
-        lines.append(f"- {bullet}")
+        yield f"- {bullet}"
 
-    lines.append("\nTimeline:")
+    yield "\nTimeline:"
     for segment in export.segments:
         speaker = segment.speaker_label or segment.speaker
-        lines.append(f"{speaker}: {segment.text}")
+        yield f"{speaker}: {segment.text}"
+
+
+def _newline_joined(lines: Iterator[str]) -> Iterator[str]:
+    """Yield chunks whose concatenation equals ``"\\n".join(lines)``."""
+
+    for index, line in enumerate(lines):
+        yield line if index == 0 else f"\n{line}"
+
+
+def iter_markdown(export: SessionExport) -> Iterator[str]:
+    """Yield the Markdown export incrementally, one line per chunk."""
+
+    return _newline_joined(_markdown_lines(export))
+
+
+def iter_text(export: SessionExport) -> Iterator[str]:
+    """Yield the plain-text export incrementally, one line per chunk."""
+
+    return _newline_joined(_text_lines(export))
+
+
+def render_markdown(export: SessionExport) -> str:
+    """Return a Markdown representation of the session export."""
+
+    return "\n".join(_markdown_lines(export))
+
+
+def render_text(export: SessionExport) -> str:
+    """Return a plain-text representation of the session export."""
 
-    return "\n".join(lines)
+    return "\n".join(_text_lines(export))
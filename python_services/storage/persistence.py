@@ -7,6 +7,7 @@ surface for manifests.
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import List
@@ -41,14 +42,7 @@ def save_export(export: SessionExport, base_dir: str) -> Path:
         "language": export.language,
         "title": export.title,
         "agenda": list(export.agenda),
-        "segments": [
-            {
-                "speaker": segment.speaker,
-                "text": segment.text,
-                "speaker_label": segment.speaker_label,
-            }
-            for segment in export.segments
-        ],
+        "segments": export.segment_dicts,
         "summary": {
             "highlight": export.summary.highlight,
             "bullet_points": export.summary.bullet_points,
@@ -60,14 +54,29 @@ def save_export(export: SessionExport, base_dir: str) -> Path:
 
 
 def load_export(session_id: str, base_dir: str) -> SessionExport:
-    """Load a previously saved session export manifest."""
+    """Load a previously saved session export manifest.
+
+    Parsed manifests are cached by path, modification time and size, so repeat
+    reads of an unchanged file skip disk IO and JSON decoding; rewriting the
+    file changes the key and bypasses the stale entry. Deleting or pruning
+    exports clears the cache so removed transcripts do not stay in memory.
+    Treat the returned export as read-only since it may be shared between
+    callers.
+    """
 
     export_dir = _export_dir(base_dir)
     path = export_dir / f"{session_id}.json"
-    if not path.exists():
-        raise FileNotFoundError(f"No export stored for session {session_id}")
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(f"No export stored for session {session_id}") from exc
+
+    return _load_export_file(str(path), stat.st_mtime_ns, stat.st_size)
+
 
-    payload = json.loads(path.read_text())
+@lru_cache(maxsize=16)
+def _load_export_file(path: str, mtime_ns: int, size: int) -> SessionExport:
+    payload = json.loads(Path(path).read_text())
     return SessionExport(
         session_id=payload["session_id"],
         created_at=datetime.fromisoformat(payload["created_at"]),
@@ -97,6 +106,7 @@ def delete_export(session_id: str, base_dir: str) -> bool:
     if not path.exists():
         return False
     path.unlink(missing_ok=True)
+    _load_export_file.cache_clear()
     return True
 
 
@@ -124,5 +134,7 @@ def prune_exports(base_dir: str, max_age_days: int, *, now: datetime | None = No
             path.unlink(missing_ok=True)
             removed.append(path.stem)
 
+    if removed:
+        _load_export_file.cache_clear()
     return sorted(removed)
 
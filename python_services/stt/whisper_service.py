@@ -21,6 +21,15 @@ class TranscriptSegment:
     end: float = 0.0
     confidence: float = 1.0
 
+    def asdict(self) -> dict:
+        return {
+            "speaker": self.speaker,
+            "text": self.text,
+            "start": self.start,
+            "end": self.end,
+            "confidence": self.confidence,
+        }
+
 
 @dataclass
 class Transcript:
@@ -31,6 +40,13 @@ class Transcript:
     def text(self) -> str:
         return " ".join(segment.text for segment in self.segments)
 
+    @classmethod
+    def from_text(cls, text: str, language: str = "fa") -> "Transcript":
+        """Wrap an already-final transcript string as a single-segment transcript."""
+        normalized = text.strip()
+        segments = [TranscriptSegment(speaker="unknown", text=normalized, start=0.0, end=1.0)] if normalized else []
+        return cls(language=language, segments=segments)
+
 
 class WhisperService:
     """Whisper-based transcription service.
@@ -111,6 +127,24 @@ class WhisperService:
         # Stub mode for testing
         return self._transcribe_stub(content, language)
     
+    def transcribe_batch(self, contents: List[str | bytes], language: str = "fa") -> List[Transcript]:
+        """
+        Transcribe several payloads in one call.
+        
+        Items are still transcribed one at a time (a loaded model sees one
+        payload per call); this only lets callers hand over a list at once.
+        
+        Args:
+            contents: Texts (for stub mode) or audio bytes
+            language: Language code shared by the batch
+            
+        Returns:
+            Transcripts in the same order as ``contents``
+        """
+        if self.model is None:
+            return [self._transcribe_stub(content, language) for content in contents]
+        return [self._transcribe_with_model(content, language, None) for content in contents]
+    
     def _transcribe_with_model(self, content: str | bytes, language: str, audio_path: Optional[str]) -> Transcript:
         """Transcribe using actual Whisper model."""
         try:
@@ -167,9 +201,7 @@ class WhisperService:
     
     def _transcribe_stub(self, content: str, language: str) -> Transcript:
         """Stub transcription for testing."""
-        normalized = content.strip() if isinstance(content, str) else ""
-        segments = [TranscriptSegment(speaker="unknown", text=normalized, start=0.0, end=1.0)] if normalized else []
-        return Transcript(language=language, segments=segments)
+        return Transcript.from_text(content if isinstance(content, str) else "", language)
     
     def transcribe_audio_file(self, audio_path: str, language: str = "fa") -> Transcript:
         """Convenience method to transcribe an audio file."""
@@ -43,6 +43,35 @@ def test_append_and_fetch_audio(monkeypatch):
     assert fetched["buffered"] == 4
 
 
+def test_append_audio_raw_body(monkeypatch):
+    import sys
+    from array import array
+
+    server = reload_server(monkeypatch)()
+    client = TestClient(server.app)
+
+    client.post("/sessions", json={"session_id": "raw"})
+    samples = array("f", [0.5, -0.25, 0.125])
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    response = client.post(
+        "/sessions/raw/audio/raw?trim_to=2",
+        headers={"content-type": "application/octet-stream"},
+        content=samples.tobytes(),
+    )
+    assert response.status_code == 200
+    assert response.json() == {"session_id": "raw", "added": 3, "buffered": 2}
+
+    fetched = client.get("/sessions/raw/audio").json()
+    assert fetched["samples"] == [-0.25, 0.125]
+
+    raw = client.get("/sessions/raw/audio/raw")
+    assert raw.status_code == 200
+    assert raw.headers["X-Buffered-Samples"] == "2"
+    assert raw.content == samples[1:].tobytes()
+
+
 def test_audio_append_validation(monkeypatch):
     server = reload_server(monkeypatch)()
     client = TestClient(server.app)
@@ -100,3 +129,47 @@ def test_process_buffer_handles_silence(monkeypatch):
     assert payload["triggered"] is False
     assert payload["segments"] == []
     assert payload["buffered"] == 3
+
+
+def test_process_buffer_keeps_audio_appended_while_transcribing(monkeypatch):
+    server = reload_server(monkeypatch)()
+    client = TestClient(server.app)
+
+    client.post("/sessions", json={"session_id": "s5"})
+    client.post("/sessions/s5/audio", json={"samples": [0.0, 0.05, 0.04, 0.0], "trim_to": 8})
+    submit = server.diarize_batcher.submit
+
+    async def diarize_while_streaming(transcript):
+        # A concurrent /audio call lands between detection and the append.
+        server.sessions.append_audio("s5", [0.2, 0.3], trim_to=8)
+        return await submit(transcript)
+
+    monkeypatch.setattr(server.diarize_batcher, "submit", diarize_while_streaming)
+    response = client.post(
+        "/sessions/s5/process_buffer", json={"threshold": 0.03, "min_run": 2, "clear_buffer": True}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["buffered"] == 2
+    session = server.sessions.get("s5")
+    assert list(session.audio_buffer) == [0.2, 0.3]
+    assert session.audio_buffer.maxlen == 8
+
+
+def test_process_buffer_for_session_deleted_mid_request(monkeypatch):
+    server = reload_server(monkeypatch)()
+    client = TestClient(server.app)
+
+    client.post("/sessions", json={"session_id": "s6"})
+    client.post("/sessions/s6/audio", json={"samples": [0.0, 0.05, 0.04, 0.0]})
+    submit = server.diarize_batcher.submit
+
+    async def diarize_then_delete(transcript):
+        server.sessions.delete("s6")
+        return await submit(transcript)
+
+    monkeypatch.setattr(server.diarize_batcher, "submit", diarize_then_delete)
+    response = client.post("/sessions/s6/process_buffer", json={"threshold": 0.03, "min_run": 2})
+
+    assert response.status_code == 404
+    assert not server.sessions.exists("s6")
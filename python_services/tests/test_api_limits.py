@@ -16,7 +16,7 @@ def reload_server(monkeypatch, max_requests: str | None = None):
 def test_rate_limit_enforced(monkeypatch):
     server = reload_server(monkeypatch, "2")
     ticks = count()
-    server.rate_limiter = server.RateLimiter(2, now=lambda: next(ticks) * (10**7))
+    server.rate_limiter = server.TokenBucket(2, now=lambda: float(next(ticks)))
 
     client = TestClient(server.app)
 
@@ -25,3 +25,12 @@ def test_rate_limit_enforced(monkeypatch):
     blocked = client.get("/health")
     assert blocked.status_code == 429
     assert blocked.json()["detail"] == "rate limit exceeded"
+
+
+def test_rate_limit_bucket_refills(monkeypatch):
+    server = reload_server(monkeypatch)
+    clock = iter([0.0, 0.0, 1.0, 2.0, 31.0, 32.0, 92.0, 92.0, 92.0])
+    limiter = server.TokenBucket(2, now=lambda: next(clock))
+
+    # One token comes back every 30s; the bucket never holds more than two.
+    assert [limiter.allow() for _ in range(8)] == [True, True, False, True, False, True, True, False]
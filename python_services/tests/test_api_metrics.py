@@ -26,3 +26,15 @@ def test_metrics_snapshot_returns_counters():
 
     assert payload["counters"]["transcribe.calls"] == 1
     assert payload["counters"]["summarize.calls"] == 1
+
+
+def test_transcribe_batch_returns_result_per_item():
+    server = reload_server()
+    client = TestClient(server.app)
+
+    response = client.post("/transcribe/batch", json={"contents": ["salam", "chetori"], "language": "fa"})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["segments"][0]["text"] for r in results] == ["salam", "chetori"]
+    assert client.get("/metrics").json()["counters"]["transcribe.batch.calls"] == 1
@@ -16,6 +16,7 @@ def reload_server(monkeypatch):
     monkeypatch.delenv("PY_SERVICES_REQUEST_ID_HEADER", raising=False)
     monkeypatch.delenv("PY_SERVICES_ALLOWED_ORIGINS", raising=False)
     monkeypatch.delenv("PY_SERVICES_MAX_REQUESTS_PER_MINUTE", raising=False)
+    monkeypatch.delenv("PY_SERVICES_MAX_BODY_BYTES", raising=False)
     return _reload
 
 
@@ -51,3 +52,129 @@ def test_cors_headers_applied(monkeypatch, reload_server):
 
     assert response.status_code == 200
     assert response.headers["access-control-allow-origin"] == "http://example.com"
+
+
+def test_cors_headers_only_for_cross_origin_requests(reload_server):
+    server = reload_server()
+    client = TestClient(server.app)
+
+    assert "access-control-allow-origin" not in client.get("/health").headers
+    wildcard = client.get("/health", headers={"origin": "http://anywhere.example"})
+    assert wildcard.headers["access-control-allow-origin"] == "*"
+
+
+def test_preflight_answered_without_auth(monkeypatch, reload_server):
+    monkeypatch.setenv("PY_SERVICES_API_KEY", "secret")
+    monkeypatch.setenv("PY_SERVICES_ALLOWED_ORIGINS", "http://example.com")
+    server = reload_server()
+    client = TestClient(server.app)
+
+    response = client.options("/transcribe", headers={"origin": "http://example.com"})
+
+    assert response.status_code == 204
+    assert response.headers["access-control-allow-origin"] == "http://example.com"
+    assert "OPTIONS" in response.headers["access-control-allow-methods"]
+    assert response.headers["access-control-max-age"] == "600"
+
+    rejected = client.options("/transcribe", headers={"origin": "http://evil.example"})
+    assert rejected.status_code == 204
+    assert "access-control-allow-origin" not in rejected.headers
+
+
+def test_rejected_requests_keep_request_id(monkeypatch, reload_server):
+    monkeypatch.setenv("PY_SERVICES_API_KEY", "secret")
+    server = reload_server()
+    client = TestClient(server.app)
+
+    response = client.get("/health", headers={"x-request-id": "abc123"})
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "invalid api key"}
+    assert response.headers["x-request-id"] == "abc123"
+
+
+def test_oversized_body_rejected(monkeypatch, reload_server):
+    monkeypatch.setenv("PY_SERVICES_MAX_BODY_BYTES", "64")
+    server = reload_server()
+    client = TestClient(server.app)
+
+    response = client.post("/vad", json={"samples": [0.5] * 64})
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "request body too large"}
+    assert client.post("/vad", json={"samples": [0.5]}).status_code == 200
+
+
+def test_streamed_body_over_limit_rejected(monkeypatch, reload_server):
+    import asyncio
+
+    monkeypatch.setenv("PY_SERVICES_MAX_BODY_BYTES", "64")
+    server = reload_server()
+    # A chunked upload declares no Content-Length; the cap must still hold.
+    chunks = [b'{"samples": [', b"0.5, " * 20, b"0.5]}"]
+    messages = []
+
+    async def receive():
+        body = chunks.pop(0)
+        return {"type": "http.request", "body": body, "more_body": bool(chunks)}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "method": "POST", "path": "/vad", "query_string": b"", "headers": []}
+    asyncio.run(server.app(scope, receive, send))
+
+    assert messages[0]["status"] == 413
+    assert messages[1]["body"] == b'{"detail":"request body too large"}'
+    assert chunks == [b"0.5]}"]
+
+
+def test_malformed_content_length_rejected(reload_server):
+    server = reload_server()
+    client = TestClient(server.app)
+
+    response = client.post("/vad", headers={"content-length": "abc"}, json={"samples": [0.5]})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "invalid content-length"}
+
+
+def test_generated_request_ids_are_unique_hex(reload_server):
+    server = reload_server()
+    client = TestClient(server.app)
+
+    ids = {client.get("/health").headers["x-request-id"] for _ in range(300)}
+
+    assert len(ids) == 300
+    assert all(len(value) == 32 and int(value, 16) >= 0 for value in ids)
+
+
+def test_health_payload(reload_server):
+    server = reload_server()
+    client = TestClient(server.app)
+
+    response = client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok", "message": "scaffold"}
+
+
+def test_unrouted_requests_and_handler_errors_get_json_answers(reload_server):
+    server = reload_server()
+
+    @server.app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    client = TestClient(server.app)
+
+    missing = client.get("/nope")
+    assert missing.status_code == 404
+    assert missing.json() == {"detail": "Not Found"}
+    assert "x-request-id" in missing.headers
+
+    assert client.delete("/health").status_code == 405
+
+    failed = client.get("/boom")
+    assert failed.status_code == 500
+    assert failed.json() == {"detail": "Internal Server Error"}
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from python_services.ops.batching import DynamicBatcher
+
+
+def test_concurrent_submissions_share_one_handler_call():
+    calls = []
+
+    def handler(items):
+        calls.append(list(items))
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = DynamicBatcher(handler, max_batch_size=8, max_wait_ms=1)
+        return await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+    assert asyncio.run(run()) == [0, 2, 4]
+    assert calls == [[0, 1, 2]]
+
+
+def test_full_batch_flushes_without_waiting():
+    calls = []
+
+    def handler(items):
+        calls.append(list(items))
+        return items
+
+    async def run():
+        batcher = DynamicBatcher(handler, max_batch_size=2, max_wait_ms=10_000)
+        return await asyncio.wait_for(asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1)
+
+    assert asyncio.run(run()) == [0, 1, 2, 3]
+    assert calls == [[0, 1], [2, 3]]
+
+
+def test_handler_errors_propagate_to_every_caller():
+    def handler(items):
+        raise ValueError("boom")
+
+    async def run():
+        batcher = DynamicBatcher(handler, max_batch_size=4, max_wait_ms=1)
+        return await asyncio.gather(batcher.submit(1), batcher.submit(2), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_handler_runs_on_supplied_executor():
+    threads = []
+
+    def handler(items):
+        threads.append(threading.current_thread().name)
+        return items
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="inference") as pool:
+            batcher = DynamicBatcher(handler, max_batch_size=1, max_wait_ms=1, executor=pool)
+            return await asyncio.gather(batcher.submit(1), batcher.submit(2))
+
+    assert asyncio.run(run()) == [1, 2]
+    assert all(name.startswith("inference") for name in threads)
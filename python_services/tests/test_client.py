@@ -1,6 +1,8 @@
 import io
 import json
+import threading
 import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 from fastapi import TestClient
 
@@ -66,3 +68,80 @@ def test_client_support_bundle(tmp_path):
     with zipfile.ZipFile(io.BytesIO(bundle_bytes)) as archive:
         exports = json.loads(archive.read("exports/index.json"))
         assert exports["export_ids"] == ["bundle"]
+
+
+def test_default_backend_reuses_connections():
+    peers = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            peers.append(self.client_address)
+            body = b'{"status":"ok"}'
+            self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with MeetingAssistantClient(f"http://127.0.0.1:{httpd.server_port}") as client:
+            assert client.health() == {"status": "ok"}
+            assert client.health() == {"status": "ok"}
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert len(peers) == 2
+    assert peers[0] == peers[1]
+
+
+def test_default_backend_does_not_replay_unanswered_posts():
+    import http.client
+
+    import pytest
+
+    from python_services.client import _PooledClient
+
+    posts = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self):
+            # Process the request, then drop the connection before answering.
+            posts.append(self.rfile.read(int(self.headers["content-length"])))
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    pooled = _PooledClient(timeout=5)
+    base = f"http://127.0.0.1:{httpd.server_port}"
+    try:
+        assert pooled.request("GET", f"{base}/health").status_code == 200
+        with pytest.raises(http.client.RemoteDisconnected):
+            pooled.request("POST", f"{base}/sessions/demo/append", json_body={"transcript": "salam"})
+    finally:
+        pooled.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+    assert len(posts) == 1
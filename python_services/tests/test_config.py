@@ -13,6 +13,11 @@ def test_default_settings():
     assert settings.export_retention_days == 30
     assert settings.allowed_origins == ["*"]
     assert settings.max_requests_per_minute is None
+    assert settings.workers == 1
+    assert settings.max_batch_size == 16
+    assert settings.batch_wait_ms == 5.0
+    assert settings.inference_threads == 4
+    assert settings.max_body_bytes == 16 * 1024 * 1024
 
 
 def test_env_overrides(monkeypatch):
@@ -26,6 +31,11 @@ def test_env_overrides(monkeypatch):
     monkeypatch.setenv("PY_SERVICES_EXPORT_RETENTION_DAYS", "45")
     monkeypatch.setenv("PY_SERVICES_ALLOWED_ORIGINS", "http://example.com, http://localhost")
     monkeypatch.setenv("PY_SERVICES_MAX_REQUESTS_PER_MINUTE", "120")
+    monkeypatch.setenv("PY_SERVICES_WORKERS", "4")
+    monkeypatch.setenv("PY_SERVICES_MAX_BATCH_SIZE", "8")
+    monkeypatch.setenv("PY_SERVICES_BATCH_WAIT_MS", "2.5")
+    monkeypatch.setenv("PY_SERVICES_INFERENCE_THREADS", "2")
+    monkeypatch.setenv("PY_SERVICES_MAX_BODY_BYTES", "1024")
 
     settings = ServiceSettings.from_env()
 
@@ -39,6 +49,11 @@ def test_env_overrides(monkeypatch):
     assert settings.export_retention_days == 45
     assert settings.allowed_origins == ["http://example.com", "http://localhost"]
     assert settings.max_requests_per_minute == 120
+    assert settings.workers == 4
+    assert settings.max_batch_size == 8
+    assert settings.batch_wait_ms == 2.5
+    assert settings.inference_threads == 2
+    assert settings.max_body_bytes == 1024
 
 
 def test_retention_can_be_disabled(monkeypatch):
@@ -2,8 +2,16 @@ import json
 from datetime import datetime, timezone
 from pathlib import Path
 
-from python_services.storage.manifests import SegmentRecord, SessionExport
+from python_services.storage.manifests import (
+    SegmentRecord,
+    SessionExport,
+    iter_markdown,
+    iter_text,
+    render_markdown,
+    render_text,
+)
 from python_services.storage.persistence import (
+    _load_export_file,
     delete_export,
     list_exports,
     load_export,
@@ -91,5 +99,44 @@ def test_delete_export_is_idempotent(tmp_path):
     )
 
     save_export(export, base_dir=str(tmp_path))
+    load_export("remove-me", base_dir=str(tmp_path))
     assert delete_export("remove-me", base_dir=str(tmp_path)) is True
     assert delete_export("remove-me", base_dir=str(tmp_path)) is False
+    # The parsed manifest must not outlive the file.
+    assert _load_export_file.cache_info().currsize == 0
+
+
+def test_load_export_reuses_parsed_manifest_until_file_changes(tmp_path):
+    export = SessionExport(
+        session_id="cached",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        language="fa",
+        segments=[SegmentRecord(speaker="spk1", text="salam")],
+        summary=Summary(highlight="hello", bullet_points=[]),
+    )
+    save_export(export, base_dir=str(tmp_path))
+
+    first = load_export("cached", base_dir=str(tmp_path))
+    assert load_export("cached", base_dir=str(tmp_path)) is first
+
+    export.title = "Renamed meeting"
+    save_export(export, base_dir=str(tmp_path))
+
+    reloaded = load_export("cached", base_dir=str(tmp_path))
+    assert reloaded is not first
+    assert reloaded.title == "Renamed meeting"
+
+
+def test_streamed_renderings_match_full_renderings():
+    export = SessionExport(
+        session_id="stream",
+        created_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        language="fa",
+        title="Review",
+        agenda=["Intro"],
+        segments=[SegmentRecord(speaker="spk1", text="salam", speaker_label="Host")],
+        summary=Summary(highlight="hello", bullet_points=["point"]),
+    )
+
+    assert "".join(iter_markdown(export)) == render_markdown(export)
+    assert "".join(iter_text(export)) == render_text(export)
@@ -1,7 +1,10 @@
+import random
+from types import SimpleNamespace
+
 import pytest
 
 from python_services.diarization.diarization_service import DiarizationService
-from python_services.stt.whisper_service import WhisperService
+from python_services.stt.whisper_service import Transcript, WhisperService
 from python_services.summarization.summarizer import Summarizer
 from python_services.tts.tts_service import TextToSpeechService
 
@@ -23,6 +26,11 @@ def test_transcribe_and_diarize(stt, diarizer):
     assert diarized[0].text == "salam chetori"
 
 
+def test_transcript_from_text_matches_stub_transcription(stt):
+    assert Transcript.from_text(" salam ", "fa") == stt.transcribe(" salam ", language="fa")
+    assert Transcript.from_text("   ").segments == []
+
+
 def test_summarizer_extracts_highlight():
     summarizer = Summarizer()
     summary = summarizer.summarize("one. two. three.", max_points=2)
@@ -35,3 +43,96 @@ def test_tts_returns_base64_payload():
     audio = tts.synthesize("salam")
     assert audio.payload.decode("utf-8") == "salam"
     assert audio.as_base64() != ""
+
+
+def test_batch_transcribe_and_diarize_preserve_order(stt, diarizer):
+    transcripts = stt.transcribe_batch(["salam", "", "khodahafez"])
+    assert [t.text for t in transcripts] == ["salam", "", "khodahafez"]
+
+    diarized = diarizer.diarize_batch(transcripts)
+    assert [len(segments) for segments in diarized] == [1, 0, 1]
+    assert diarized[2][0].text == "khodahafez"
+
+
+def test_diarize_columns_match_segment_dicts(stt, diarizer):
+    transcript = stt.transcribe("salam chetori")
+    columns = diarizer.diarize_columns(transcript)
+    assert len(columns) == 1
+    assert columns.asdicts() == [segment.asdict() for segment in diarizer.diarize(transcript)]
+
+
+class _FakeAnnotation:
+    def __init__(self, tracks):
+        self.tracks = tracks
+
+    def itertracks(self, yield_label=False):
+        for start, end, speaker in self.tracks:
+            yield SimpleNamespace(start=start, end=end), None, speaker
+
+
+def test_speaker_lookups_match_full_scan(diarizer):
+    rng = random.Random(7)
+    tracks = []
+    for _ in range(200):
+        start = rng.uniform(0, 600)
+        tracks.append((start, start + rng.uniform(0.2, 30), rng.choice("ABC")))
+    tracks.sort()  # pyannote yields tracks in time order
+    turns = diarizer._index_turns(_FakeAnnotation(tracks))
+
+    segments = []
+    for _ in range(600):
+        start = rng.uniform(0, 620)
+        end = start + rng.uniform(0.1, 10)
+        totals = {}
+        for turn_start, turn_end, speaker in tracks:
+            overlap = min(end, turn_end) - max(start, turn_start)
+            if overlap > 0:
+                totals[speaker] = totals.get(speaker, 0.0) + overlap
+        expected = max(totals.items(), key=lambda x: x[1])[0] if totals else "unknown"
+        assert diarizer._find_speaker_for_segment(start, end, turns) == expected
+        segments.append((start, end, expected))
+
+    starts, ends, expected = zip(*segments)
+    assert diarizer._assign_speakers(list(starts), list(ends), turns) == list(expected)
+
+
+def test_pipeline_turns_reused_until_audio_changes(diarizer, tmp_path, monkeypatch):
+    audio = tmp_path / "meeting.wav"
+    audio.write_bytes(b"v1")
+    calls = []
+
+    def pipeline(source):
+        calls.append(source)
+        return _FakeAnnotation([(0.0, 2.0, "A")])
+
+    diarizer.diarization_pipeline = pipeline
+    monkeypatch.setattr(diarizer, "_load_audio", lambda path: path)
+
+    first = diarizer._turns_for(str(audio))
+    assert diarizer._turns_for(str(audio)) is first
+    audio.write_bytes(b"v2-longer")
+    assert diarizer._turns_for(str(audio)) is not first
+    assert len(calls) == 2
+
+
+def test_identify_speaker_matches_enrolled_embeddings(diarizer, monkeypatch):
+    embeddings = {b"ali": [1.0, 0.1, 0.0], b"sara": [0.0, 1.0, 0.2], b"other": [0.0, 0.0, 1.0]}
+    diarizer.embedding_model = object()
+    monkeypatch.setattr(diarizer, "_extract_embedding", lambda chunk, rate: embeddings[chunk])
+
+    diarizer.enroll_speaker("ali", b"ali")
+    diarizer.enroll_speaker("sara", b"sara")
+
+    assert diarizer.identify_speaker(b"ali") == "ali"
+    assert diarizer.identify_speaker(b"sara") == "sara"
+    assert diarizer.identify_speaker(b"other") is None
+
+
+def test_segment_asdict_matches_dataclass_fields(stt, diarizer):
+    from dataclasses import asdict
+
+    transcript = stt.transcribe("salam")
+    diarized = diarizer.diarize(transcript)
+
+    assert transcript.segments[0].asdict() == asdict(transcript.segments[0])
+    assert diarized[0].asdict() == asdict(diarized[0])
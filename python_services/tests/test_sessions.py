@@ -47,7 +47,7 @@ def test_session_summary_endpoint(monkeypatch):
             transcript_id="s-demo", language="fa", segments=server.diarization.diarize(server.stt.transcribe("salam"))
         ).segments,
     )
-    summary = store.summary("s-demo", server.summarizer)
+    _, summary = store.summary("s-demo", server.summarizer)
     assert summary.highlight
     assert summary.bullet_points
 
@@ -9,13 +9,18 @@ def test_append_and_trim_audio_buffer():
     store.create("s1")
 
     session = store.append_audio("s1", [0.1, 0.2, 0.3])
-    assert session.audio_buffer == [0.1, 0.2, 0.3]
+    assert list(session.audio_buffer) == [0.1, 0.2, 0.3]
 
     store.append_audio("s1", [0.4, 0.5], trim_to=4)
-    assert session.audio_buffer == [0.2, 0.3, 0.4, 0.5]
+    assert list(session.audio_buffer) == [0.2, 0.3, 0.4, 0.5]
+    assert session.buffered == 4
 
     snapshot = store.audio_samples("s1", max_samples=2)
     assert snapshot == [0.4, 0.5]
+    assert store.audio_view("s1", max_samples=2) == (session, [0.4, 0.5])
+
+    assert session.append_audio([0.6, 0.7, 0.8, 0.9, 1.0], trim_to=3) == 5
+    assert list(session.audio_buffer) == [0.8, 0.9, 1.0]
 
 
 def test_audio_buffer_requires_session():
@@ -43,4 +48,9 @@ def test_process_audio_buffer_appends_and_optionally_clears():
     assert spans == [SpeechSpan(start_index=1, end_index=2)]
     assert len(session.segments) >= 1
     assert new_speakers
-    assert session.audio_buffer == []
+    assert not session.audio_buffer
+    # Segments are stored as diarized, timestamps included, like the API path.
+    direct = diarization.diarize(stt.transcribe("buffer processing: buffer 1-2", language=session.language))
+    assert [(s.speaker, s.text, s.start, s.end) for s in session.segments] == [
+        (s.speaker, s.text, s.start, s.end) for s in direct
+    ]
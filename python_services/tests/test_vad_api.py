@@ -38,3 +38,108 @@ def test_vad_requires_positive_run_length(monkeypatch):
 
     assert response.status_code == 400
     assert response.json()["detail"] == "min_run must be >= 1"
+
+
+def test_vad_accepts_base64_float32_samples(monkeypatch):
+    import base64
+    import sys
+    from array import array
+
+    server = reload_server(monkeypatch)()
+    samples = array("f", [0.0, 0.02, 0.03, 0.025, 0.0])
+    if sys.byteorder == "big":
+        samples.byteswap()
+    encoded = base64.b64encode(samples.tobytes()).decode("ascii")
+
+    client = TestClient(server.app)
+    response = client.post("/vad", json={"samples_b64": encoded, "threshold": 0.015, "min_run": 2})
+
+    assert response.status_code == 200
+    assert response.json()["segments"] == [{"start_index": 1, "end_index": 3}]
+
+
+def test_vad_rejects_malformed_base64(monkeypatch):
+    server = reload_server(monkeypatch)()
+
+    client = TestClient(server.app)
+    response = client.post("/vad", json={"samples_b64": "not base64!"})
+
+    assert response.status_code == 400
+
+
+def test_vad_silent_buffer_not_triggered(monkeypatch):
+    server = reload_server(monkeypatch)()
+
+    client = TestClient(server.app)
+    response = client.post("/vad", json={"samples": [0.0, -0.001, 0.002, 0.0], "threshold": 0.01, "min_run": 1})
+
+    assert response.status_code == 200
+    assert response.json() == {"triggered": False, "segments": []}
+
+
+def test_vad_raw_float32_body(monkeypatch):
+    import sys
+    from array import array
+
+    server = reload_server(monkeypatch)()
+    samples = array("f", [0.0, 0.02, 0.03, 0.025, 0.0])
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    client = TestClient(server.app)
+    response = client.post(
+        "/vad/raw?threshold=0.015&min_run=2",
+        headers={"content-type": "application/octet-stream"},
+        content=samples.tobytes(),
+    )
+
+    assert response.status_code == 200
+    assert response.json()["segments"] == [{"start_index": 1, "end_index": 3}]
+
+    truncated = client.post("/vad/raw", headers={"content-type": "application/octet-stream"}, content=b"\x00" * 6)
+    assert truncated.status_code == 400
+
+
+def test_vad_raw_body_without_content_type(monkeypatch):
+    import sys
+    from array import array
+
+    server = reload_server(monkeypatch)()
+    samples = array("f", [0.0, 0.02, 0.03, 0.025, 0.0])
+    if sys.byteorder == "big":
+        samples.byteswap()
+
+    client = TestClient(server.app)
+    response = client.post("/vad/raw?threshold=0.015&min_run=2", content=samples.tobytes())
+
+    assert response.status_code == 200
+    assert response.json()["segments"] == [{"start_index": 1, "end_index": 3}]
+
+
+def test_vad_rejects_malformed_json(monkeypatch):
+    server = reload_server(monkeypatch)()
+
+    client = TestClient(server.app)
+    invalid = client.post("/vad", headers={"content-type": "application/json"}, content=b'{"samples": [0.1,')
+    not_object = client.post("/vad", json=[0.1, 0.2])
+
+    assert invalid.status_code == 400
+    assert invalid.json() == {"detail": "request body must be valid JSON"}
+    assert not_object.status_code == 422
+
+
+def test_vectorized_vad_matches_python_scan():
+    import random
+
+    import pytest
+
+    np = pytest.importorskip("numpy")
+    from python_services.vad import simple_vad
+
+    rng = random.Random(7)
+    samples = [rng.choice([0.0, rng.uniform(-0.05, 0.05)]) for _ in range(4096)]
+
+    expected = simple_vad._spans_python(samples, 0.02, 3)
+    assert expected
+    assert simple_vad.detect_speech(samples, threshold=0.02, min_run=3) == expected
+    assert simple_vad.detect_speech(np.asarray(samples), threshold=0.02, min_run=3) == expected